@@ -0,0 +1,100 @@
+"""
+키워드 매처 벤치마크
+--------------------------------
+기존 구현(키워드마다 str.contains, 행마다 이중 루프 infer_category)과
+matcher.KeywordMatcher를 행 수/키워드 수별로 비교한다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_matcher.py
+    python benchmarks/bench_matcher.py --rows 10000 100000 --keywords 50
+"""
+
+import os, sys, time, random, argparse
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from matcher import KeywordMatcher
+
+# ===============================
+# 기존 구현 (비교 기준)
+# ===============================
+def legacy_keyword_mask(series: pd.Series, keywords: list) -> pd.Series:
+    mask = pd.Series(False, index=series.index)
+    for kw in keywords:
+        mask |= series.str.contains(kw, case=False, regex=False, na=False)
+    return mask
+
+def legacy_infer_category(name: str, category_map: dict) -> str:
+    for cat, keywords in category_map.items():
+        for keyword in keywords:
+            if keyword.lower() in str(name).lower():
+                return cat
+    return "기타"
+
+# ===============================
+# 합성 데이터
+# ===============================
+SYLLABLES = "가나다라마바사아자차카타파하강남역삼서초종로스타벅스커피마트치킨버거주유택시"
+
+def random_word(rng: random.Random, lo=2, hi=4) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(lo, hi)))
+
+def make_keywords(n: int, rng: random.Random) -> list:
+    words = set()
+    while len(words) < n:
+        words.add(random_word(rng))
+    return sorted(words)
+
+def make_category_map(keywords: list) -> dict:
+    cats = ["오락", "식비", "교통", "쇼핑"]
+    cmap = {c: [] for c in cats}
+    for i, kw in enumerate(keywords):
+        cmap[cats[i % len(cats)]].append(kw)
+    cmap["기타"] = []
+    return cmap
+
+def make_merchants(rows: int, unique: int, rng: random.Random) -> pd.Series:
+    pool = [f"{random_word(rng)} {random_word(rng, 1, 3)}점" for _ in range(unique)]
+    return pd.Series([rng.choice(pool) for _ in range(rows)])
+
+# ===============================
+# 실행부
+# ===============================
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="키워드 매처 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--keywords", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--unique", type=int, default=500, help="고유 가맹점 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'rows':>9} {'kw':>4} | {'filter old':>10} {'new':>8} {'x':>6} | {'category old':>12} {'new':>8} {'x':>6}")
+    for rows in args.rows:
+        merchants = make_merchants(rows, args.unique, rng)
+        for n_kw in args.keywords:
+            keywords = make_keywords(n_kw, rng)
+            cmap = make_category_map(keywords)
+            filter_kws = keywords[: max(1, n_kw // 10)]
+
+            old_mask, t_old_f = timed(lambda: legacy_keyword_mask(merchants, filter_kws))
+            new_mask, t_new_f = timed(lambda: KeywordMatcher(filter_kws).mask(merchants))
+            assert old_mask.equals(new_mask)
+
+            old_cat, t_old_c = timed(lambda: merchants.apply(legacy_infer_category, args=(cmap,)))
+            labels = [c for c, kws in cmap.items() for _ in kws]
+            new_cat, t_new_c = timed(
+                lambda: KeywordMatcher([k for kws in cmap.values() for k in kws], labels)
+                .label_series(merchants, "기타"))
+            assert old_cat.equals(new_cat)
+
+            print(f"{rows:>9,} {n_kw:>4} | {t_old_f:>9.3f}s {t_new_f:>7.3f}s {t_old_f / t_new_f:>5.1f}x"
+                  f" | {t_old_c:>11.3f}s {t_new_c:>7.3f}s {t_old_c / t_new_c:>5.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+키워드 분석 경로 메모리 벤치마크
+--------------------------------
+전처리 → 키워드 필터 → 결과 표 준비 → CSV 저장을 이전 방식(단계마다 복사/concat)과
+현재 방식으로 각각 새 프로세스에서 실행해 최대 RSS와 tracemalloc 최대치를 비교한다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --rows 100000
+"""
+
+import os, sys, json, time, random, argparse, tempfile, subprocess, tracemalloc
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from pipeline import (
+    COL_STORE, COL_AMOUNT, normalize_text_series, normalize_DT_column,
+    preprocess_dataframe, filter_by_keywords,
+)
+from export import export_frame
+from tracing import peak_rss_bytes
+
+KEYWORDS = ["카페", "스타벅스", "노래"]
+MERCHANTS = ["스타벅스 강남점", "코인노래방", "GS25 역삼", "쿠팡", "카카오T 택시",
+             "이디야커피", "무신사", "동네식당", "KTX", "볼링장", "카페 온더록", "동네 마트"]
+
+# ===============================
+# 이전 구현 (비교 기준)
+# ===============================
+def legacy_preprocess(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = df.columns.str.strip()
+    df[COL_STORE] = normalize_text_series(df[COL_STORE])
+    df = df[~df[COL_STORE].isin(["이용하신 가맹점", "올라운드 선택1 할인"])]
+    df[COL_AMOUNT] = pd.to_numeric(df[COL_AMOUNT], errors="coerce").fillna(0)
+    df = normalize_DT_column(df)
+    df["_is_tx"] = True
+    df["_is_tx"] &= df[COL_STORE].astype(str).str.strip().ne("") & df[COL_STORE].notna()
+    amt = pd.to_numeric(df[COL_AMOUNT], errors="coerce").fillna(0)
+    df["_is_tx"] &= amt.abs() > 0
+    return df
+
+def legacy_analysis(df: pd.DataFrame, out_path: str):
+    df = df.copy()
+    mask = pd.Series(False, index=df.index)
+    for kw in KEYWORDS:
+        mask |= df[COL_STORE].str.contains(kw, case=False, regex=False, na=False)
+    filtered = df[mask].copy()
+
+    # 이전 populate_table의 표시용 복사본
+    view = filtered[["DT", COL_STORE, COL_AMOUNT]].copy()
+    view["DT"] = pd.to_datetime(view["DT"], errors="coerce").dt.strftime("%y-%m-%d")
+    view[COL_AMOUNT] = view[COL_AMOUNT].map(lambda x: f"{x:,.0f}")
+
+    out_df = filtered.copy()
+    total_row = {col: "" for col in out_df.columns}
+    total_row[COL_STORE] = "합계"
+    total_row[COL_AMOUNT] = out_df[COL_AMOUNT].sum()
+    out_df = pd.concat([out_df, pd.DataFrame([total_row])], ignore_index=True)
+    out_df.to_csv(out_path, encoding="utf-8-sig", index=False)
+
+def current_analysis(df: pd.DataFrame, out_path: str):
+    filtered = filter_by_keywords(df, KEYWORDS)
+    # 표 모델은 컬럼 배열을 참조만 한다
+    [filtered[c].to_numpy() for c in ("DT", COL_STORE, COL_AMOUNT)]
+    export_frame(filtered, out_path, "csv")
+
+# ===============================
+# 합성 원본 (리더 출력과 같은 object 컬럼)
+# ===============================
+def make_raw_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    dates = pd.Series(pd.date_range("2023-01-01", "2024-12-31", freq="D").strftime("%y.%m.%d"))
+    return pd.DataFrame({
+        "이용일자": dates.sample(rows, replace=True, random_state=seed).to_numpy().astype(object),
+        COL_STORE: np.array([rng.choice(MERCHANTS) for _ in range(rows)], dtype=object),
+        COL_AMOUNT: np.array([rng.randint(0, 200) * 100 for _ in range(rows)], dtype=object),
+        "승인번호": np.arange(rows).astype(object),
+    })
+
+def run_variant(variant: str, rows: int) -> dict:
+    raw = make_raw_frame(rows)
+    base_rss = peak_rss_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, "out.csv")
+        if variant == "legacy":
+            df = legacy_preprocess(raw)
+            del raw
+            legacy_analysis(df, out_path)
+        else:
+            df = preprocess_dataframe(raw)
+            del raw
+            current_analysis(df, out_path)
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak = peak_rss_bytes()
+    return {
+        "variant": variant,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "tracemalloc_peak_mb": round(traced_peak / 2**20, 1),
+        "peak_rss_mb": round(peak / 2**20, 1) if peak else None,
+        "peak_rss_growth_mb": round((peak - base_rss) / 2**20, 1) if peak and base_rss else None,
+    }
+
+# ===============================
+# 실행부
+# ===============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="키워드 분석 경로 메모리 벤치마크")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--variant", choices=["legacy", "current"], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.rows)))
+        return
+
+    results = []
+    for variant in ("legacy", "current"):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--rows", str(args.rows),
+                              "--variant", variant], capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f"{'variant':<8} {'rows':>9} {'sec':>7} {'tracemalloc MB':>15} {'peak RSS MB':>12} {'RSS growth MB':>14}")
+    for r in results:
+        print(f"{r['variant']:<8} {r['rows']:>9,} {r['seconds']:>7.2f} {r['tracemalloc_peak_mb']:>15.1f}"
+              f" {r['peak_rss_mb'] or 0:>12.1f} {r['peak_rss_growth_mb'] or 0:>14.1f}")
+    old, new = results
+    if old["tracemalloc_peak_mb"]:
+        print(f"tracemalloc 최대치 {100 * (1 - new['tracemalloc_peak_mb'] / old['tracemalloc_peak_mb']):.0f}% 감소")
+    if old["peak_rss_growth_mb"] and new["peak_rss_growth_mb"] is not None:
+        print(f"최대 RSS 증가분 {100 * (1 - new['peak_rss_growth_mb'] / old['peak_rss_growth_mb']):.0f}% 감소")
+
+if __name__ == "__main__":
+    main()
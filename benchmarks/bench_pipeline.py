@@ -0,0 +1,198 @@
+"""
+파이프라인 단계별 벤치마크
+--------------------------------
+합성 명세서(synthetic.py)로 공개 단계 함수를 하나씩 재고 JSON으로 남긴다.
+
+    load_excel_from_path → normalize_text_series → normalize_DT_column → preprocess_dataframe
+    → filter_by_keywords → infer_category_series → generate_category_summary
+    → populate_table (오프스크린 Qt) → CSV 내보내기
+
+각 단계는 --repeat번 실행해 최소/중앙값(ms)을 기록한다. 기준 파일이 있으면 단계별 최소값을 비교해
+허용 비율(--tolerance)과 최소 차이(--min-delta-ms)를 모두 넘게 느려진 단계가 있으면 종료 코드 1로 끝난다.
+기준은 측정한 컴퓨터의 결과이므로 각자 --save-baseline으로 만들어 둔다. 기준 파일이 없으면 비교 없이
+0으로 끝나지만, --require-baseline을 주면 (CI 등) 종료 코드 2로 실패한다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_pipeline.py --save-baseline          # 현재 결과를 기준으로 저장
+    python benchmarks/bench_pipeline.py                          # 기준과 비교
+    python benchmarks/bench_pipeline.py --require-baseline       # 기준 파일이 없으면 실패
+    python benchmarks/bench_pipeline.py --rows 20000 --repeat 5 --json result.json
+    python benchmarks/bench_pipeline.py --input my_statement.xlsx
+"""
+
+import os, sys, json, time, platform, argparse, statistics, tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+sys.path.insert(0, BENCH_DIR)
+
+import pandas as pd
+
+from pipeline import (
+    COL_STORE, load_excel_from_path, normalize_text_series, normalize_DT_column,
+    preprocess_dataframe, filter_by_keywords, infer_category_series, generate_category_summary,
+)
+from export import export_frame
+from synthetic import write_statement
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline_pipeline.json")
+KEYWORDS = ["카페", "스타벅스", "노래", "GS25"]
+
+# ===============================
+# 측정
+# ===============================
+def measure(fn, setup=None, repeat: int = 3) -> dict:
+    """fn(setup())을 repeat번 실행한 시간 (setup은 시간에 넣지 않는다)"""
+    times, result = [], None
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        result = fn(arg) if setup else fn()
+        times.append((time.perf_counter() - start) * 1000)
+    record = {"min_ms": round(min(times), 2), "median_ms": round(statistics.median(times), 2)}
+    if hasattr(result, "__len__"):
+        record["rows_out"] = len(result)
+    return record
+
+def make_window():
+    """오프스크린 Qt에서 메인 창을 띄우고 데이터 모듈까지 로드"""
+    from PySide6.QtWidgets import QApplication
+    import main
+
+    app = QApplication.instance() or QApplication([])
+    window = main.ExcelSumApp()
+    window.finish_startup()
+    window.show()
+    app.processEvents()
+    return app, window
+
+def run_steps(path: str, repeat: int, tmp_dir: str) -> dict:
+    steps = {}
+    steps["load_excel_from_path"] = measure(lambda: load_excel_from_path(path), repeat=repeat)
+    raw = load_excel_from_path(path)
+
+    steps["normalize_text_series"] = measure(lambda: normalize_text_series(raw[COL_STORE]), repeat=repeat)
+    steps["normalize_DT_column"] = measure(normalize_DT_column, setup=raw.copy, repeat=repeat)
+    steps["preprocess_dataframe"] = measure(preprocess_dataframe, setup=raw.copy, repeat=repeat)
+    df = preprocess_dataframe(raw.copy())
+
+    steps["filter_by_keywords"] = measure(lambda: filter_by_keywords(df, KEYWORDS), repeat=repeat)
+    filtered = filter_by_keywords(df, KEYWORDS)
+    steps["infer_category_series"] = measure(lambda: infer_category_series(df[COL_STORE]), repeat=repeat)
+    steps["generate_category_summary"] = measure(lambda: generate_category_summary(df), repeat=repeat)
+
+    app, window = make_window()
+
+    def populate():
+        window.populate_table(filtered)
+        app.processEvents()     # 보이는 행 그리기까지
+        return filtered
+    steps["populate_table"] = measure(populate, repeat=repeat)
+    window.close()
+
+    out_path = os.path.join(tmp_dir, "export.csv")
+    steps["export_csv"] = measure(lambda: export_frame(df, out_path, "csv"), repeat=repeat)
+    steps["export_csv"]["rows_out"] = len(df)
+    return steps
+
+# ===============================
+# 기준 비교
+# ===============================
+def compare(result: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """느려진 단계 목록 [(단계, 기준 ms, 현재 ms)]"""
+    regressions = []
+    for name, cur in result["steps"].items():
+        base = baseline["steps"].get(name)
+        if base is None:
+            continue
+        if (cur["min_ms"] > base["min_ms"] * (1 + tolerance)
+                and cur["min_ms"] - base["min_ms"] > min_delta_ms):
+            regressions.append((name, base["min_ms"], cur["min_ms"]))
+    return regressions
+
+def print_table(result: dict, baseline: dict = None):
+    print(f"{'단계':<28}{'최소 ms':>11}{'중앙값 ms':>11}{'기준 ms':>11}{'비율':>8}")
+    for name, cur in result["steps"].items():
+        base = (baseline or {}).get("steps", {}).get(name)
+        base_ms = f"{base['min_ms']:>11.1f}" if base else f"{'-':>11}"
+        ratio = f"{cur['min_ms'] / base['min_ms']:>7.2f}x" if base and base["min_ms"] else f"{'-':>8}"
+        print(f"{name:<28}{cur['min_ms']:>11.1f}{cur['median_ms']:>11.1f}{base_ms}{ratio}")
+
+# ===============================
+# 실행부
+# ===============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 명세서 거래 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--input", help="합성 명세서 대신 사용할 엑셀 파일")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="결과 JSON 저장 경로 (기본: 표준 출력에 요약만)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 파일로 저장")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="기준 파일이 없으면 비교를 건너뛰지 않고 종료 코드 2로 실패")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="허용 비율 (0.3 = 30%% 느려짐까지)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="이보다 작은 차이는 무시")
+    args = parser.parse_args(argv)
+    for name in ("input", "json", "baseline"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # 카테고리 색인/캐시/최근 파일이 작업 폴더를 건드리지 않도록 임시 폴더에서 실행
+        os.chdir(tmp)
+        path = args.input
+        if path is None:
+            path = write_statement(os.path.join(tmp, "statement.xlsx"), args.rows, args.seed)
+        result = {
+            "meta": {
+                "input": os.path.basename(args.input) if args.input else "synthetic",
+                "rows": None if args.input else args.rows,
+                "seed": None if args.input else args.seed,
+                "repeat": args.repeat,
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "platform": platform.platform(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "steps": run_steps(path, args.repeat, tmp),
+        }
+        os.chdir(cwd)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print_table(result)
+        print(f"기준 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print_table(result)
+        if args.require_baseline:
+            print(f"실패: 기준 파일이 없습니다 (--save-baseline으로 생성): {args.baseline}")
+            return 2
+        print(f"기준 파일이 없어 비교하지 않습니다 (--save-baseline으로 생성): {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print_table(result, baseline)
+    if (baseline["meta"].get("input"), baseline["meta"].get("rows")) != (result["meta"]["input"], result["meta"]["rows"]):
+        print(f"실패: 기준과 입력이 다릅니다 (기준 {baseline['meta'].get('input')} {baseline['meta'].get('rows')}행)")
+        return 1
+
+    regressions = compare(result, baseline, args.tolerance, args.min_delta_ms)
+    for name, base_ms, cur_ms in regressions:
+        print(f"실패: {name} {base_ms:.1f} ms → {cur_ms:.1f} ms ({cur_ms / base_ms:.2f}배)")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
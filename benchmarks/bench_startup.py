@@ -0,0 +1,99 @@
+"""
+GUI 시작 시간 벤치마크
+--------------------------------
+새 프로세스에서 main.py를 import 하고 창을 띄워
+- import 시간 (import main)
+- 첫 화면까지 시간 (import 시작 → 메인 창 첫 paintEvent)
+- 데이터 모듈 로드 완료까지 시간 (finish_startup 종료)
+을 여러 번 재고 중앙값을 출력한다. 첫 화면 전에 pandas/matplotlib이 import 되었거나
+기준 시간을 넘으면 종료 코드 1로 끝난다.
+
+실행 (저장소 루트에서, 화면이 없으면 QT_QPA_PLATFORM=offscreen이 자동 적용):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --max-first-paint-ms 800
+"""
+
+import os, sys, json, time, argparse, statistics, tempfile, subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+HEAVY_MODULES = ("pandas", "matplotlib", "pyarrow")
+
+# ===============================
+# 측정 (자식 프로세스)
+# ===============================
+def measure_once() -> dict:
+    sys.path.insert(0, SRC)
+    start = time.perf_counter()
+    import main
+    imported = time.perf_counter()
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    window = main.ExcelSumApp()
+    window.show()
+
+    heavy_at_paint = None
+    deadline = time.perf_counter() + 30
+    while not window.ready and time.perf_counter() < deadline:
+        app.processEvents()
+        if heavy_at_paint is None and window.first_paint_at is not None:
+            heavy_at_paint = [m for m in HEAVY_MODULES if m in sys.modules]
+        time.sleep(0.001)
+    ready = time.perf_counter()
+
+    return {
+        "import_ms": (imported - start) * 1000,
+        "first_paint_ms": (window.first_paint_at - start) * 1000 if window.first_paint_at else None,
+        "ready_ms": (ready - start) * 1000 if window.ready else None,
+        "heavy_before_paint": heavy_at_paint or [],
+    }
+
+# ===============================
+# 실행부
+# ===============================
+def run_child(env) -> dict:
+    with tempfile.TemporaryDirectory() as cwd:
+        # 임시 디렉터리에서 실행 → config.json은 프로그램 폴더에서 찾고 로그/최근 파일은 여기에 남는다
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                             cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=1500)
+    parser.add_argument("--max-first-paint-ms", type=float, default=3000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_once()))
+        return 0
+
+    env = dict(os.environ)
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    results = [run_child(env) for _ in range(args.runs)]
+    median = {k: statistics.median(r[k] for r in results if r[k] is not None)
+              for k in ("import_ms", "first_paint_ms", "ready_ms")}
+    heavy = sorted({m for r in results for m in r["heavy_before_paint"]})
+
+    print(f"{'항목':<20}{'중앙값 ms':>12}{'최소 ms':>12}{'최대 ms':>12}")
+    for key, label in (("import_ms", "import main"), ("first_paint_ms", "첫 화면"), ("ready_ms", "데이터 모듈 로드")):
+        values = [r[key] for r in results if r[key] is not None]
+        print(f"{label:<20}{median[key]:>12.1f}{min(values):>12.1f}{max(values):>12.1f}")
+
+    failures = []
+    if heavy:
+        failures.append(f"첫 화면 전에 import 됨: {', '.join(heavy)}")
+    if median["import_ms"] > args.max_import_ms:
+        failures.append(f"import 시간 {median['import_ms']:.0f} ms > {args.max_import_ms:.0f} ms")
+    if median["first_paint_ms"] > args.max_first_paint_ms:
+        failures.append(f"첫 화면 {median['first_paint_ms']:.0f} ms > {args.max_first_paint_ms:.0f} ms")
+    for msg in failures:
+        print("실패:", msg)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+합성 카드 명세서 생성기
+--------------------------------
+벤치마크/수동 확인용으로 실제 카드사 엑셀과 비슷한 명세서를 만든다.
+
+- 첫 행은 안내문, 두 번째 행이 헤더 (이용일자, 이용하신 가맹점, 이용금액, 승인번호, 비고)
+- 가맹점명은 CATEGORY_MAP 키워드 + 지점명, 분류되지 않는 상호, 특수공백/연속 공백 잡음
+- 날짜는 yy.mm.dd / yyyy-mm-dd / yyyy/mm/dd HH:MM / 엑셀 날짜가 섞여 있다
+- 중간에 반복 헤더, 할인 안내 행, 빈 행, 0원 행, 마지막에 합계 행
+
+실행 (저장소 루트에서):
+    python benchmarks/synthetic.py --rows 100000 -o statement_100k.xlsx
+"""
+
+import os, sys, random, argparse, datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from config import get_config
+
+CONFIG = get_config()
+COL_STORE = CONFIG["COL_STORE"]
+COL_AMOUNT = CONFIG["COL_AMOUNT"]
+
+HEADER = ["이용일자", COL_STORE, COL_AMOUNT, "승인번호", "비고"]
+BRANCHES = ["강남", "역삼", "서초", "종로", "홍대입구", "판교", "해운대", "동성로", "둔산", "수원역"]
+UNCATEGORIZED = ["동네식당", "김밥천국", "한솥도시락", "다이소", "올리브영", "교보문고", "CGV", "약국", "세탁소", "미용실"]
+JUNK_STORES = ["올라운드 선택1 할인", COL_STORE]
+DATE_STYLES = ("yy.mm.dd", "yyyy-mm-dd", "yyyy/mm/dd HH:MM", "excel")
+
+# 행 종류 비율
+ZERO_AMOUNT_RATE = 0.02
+JUNK_ROW_RATE = 0.005
+BLANK_ROW_RATE = 0.002
+
+def merchant_pool(category_map: dict, size: int, rng: random.Random) -> list:
+    """CATEGORY_MAP 키워드와 분류되지 않는 상호로 가맹점명 size개"""
+    keywords = [kw for kws in category_map.values() for kw in kws]
+    pool = []
+    for _ in range(size):
+        if rng.random() < 0.8 and keywords:
+            name = f"{rng.choice(keywords)} {rng.choice(BRANCHES)}점"
+        else:
+            name = rng.choice(UNCATEGORIZED) + (f" {rng.choice(BRANCHES)}" if rng.random() < 0.5 else "")
+        pool.append(name)
+    return pool
+
+def add_noise(name: str, rng: random.Random) -> str:
+    """엑셀 원본에서 흔한 공백 잡음 (전처리에서 정리되어야 함)"""
+    r = rng.random()
+    if r < 0.03:
+        return name.replace(" ", "\xa0")
+    if r < 0.05:
+        return name + "\u200b"
+    if r < 0.08:
+        return f" {name}  ".replace(" ", "  ", 1)
+    return name
+
+def format_date(day: datetime.date, style: str, rng: random.Random):
+    if style == "yy.mm.dd":
+        return day.strftime("%y.%m.%d")
+    if style == "yyyy-mm-dd":
+        return day.strftime("%Y-%m-%d")
+    if style == "yyyy/mm/dd HH:MM":
+        return day.strftime("%Y/%m/%d") + f" {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}"
+    return datetime.datetime(day.year, day.month, day.day)
+
+def generate_rows(rows: int, seed: int = 0, merchants: int = 2000, days: int = 730):
+    """헤더 아래 본문 행을 생성 (거래 rows개 + 잡음 행)"""
+    rng = random.Random(seed)
+    pool = merchant_pool(CONFIG["CATEGORY_MAP"], merchants, rng)
+    start = datetime.date(2023, 1, 1)
+    # 파일 안에서 구간마다 날짜 형식이 바뀐다 (형식 재판별 경로)
+    segment = max(1, rows // len(DATE_STYLES))
+
+    for i in range(rows):
+        r = rng.random()
+        if r < JUNK_ROW_RATE:
+            yield [None, rng.choice(JUNK_STORES), None if rng.random() < 0.5 else -rng.randint(1, 50) * 100, None, None]
+        elif r < JUNK_ROW_RATE + BLANK_ROW_RATE:
+            yield [None, None, None, None, None]
+
+        day = start + datetime.timedelta(days=rng.randrange(days))
+        style = DATE_STYLES[min(i // segment, len(DATE_STYLES) - 1)]
+        amount = 0 if rng.random() < ZERO_AMOUNT_RATE else rng.randint(1, 3000) * 100
+        yield [
+            format_date(day, style, rng),
+            add_noise(rng.choice(pool), rng),
+            amount if rng.random() < 0.9 else f"{amount}",
+            f"{rng.randrange(10**8):08d}",
+            "해외" if rng.random() < 0.01 else None,
+        ]
+
+def write_statement(path: str, rows: int, seed: int = 0, merchants: int = 2000) -> str:
+    """합성 명세서를 xlsx로 저장 (openpyxl write-only)"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("이용내역")
+    ws.append([f"카드 이용대금 명세서 (합성 데이터, {rows:,}건)"])
+    ws.append(HEADER)
+    total = 0
+    for row in generate_rows(rows, seed, merchants):
+        if isinstance(row[2], int) and row[0] is not None:
+            total += row[2]
+        ws.append(row)
+    ws.append([None, "합계", total, None, None])
+    wb.save(path)
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 카드 명세서 생성")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--merchants", type=int, default=2000, help="고유 가맹점 수")
+    parser.add_argument("-o", "--output", default="synthetic_statement.xlsx")
+    args = parser.parse_args(argv)
+    write_statement(args.output, args.rows, args.seed, args.merchants)
+    print(f"{args.output}: {args.rows:,}건, {os.path.getsize(args.output) / 2**20:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+명세서 일괄 분석 CLI
+--------------------------------
+GUI 없이 여러 명세서 파일을 병렬로 읽어 키워드 합계/카테고리 요약 CSV를 만든다.
+
+사용 예 (config.json이 있는 저장소 루트에서):
+    PYTHONPATH=src python -m batch ./statements -k 카페,노래방 -o ./out
+    PYTHONPATH=src python -m batch "./statements/2024-*.xlsx" -j 8
+"""
+
+import sys, os, glob, time, argparse, logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+from pipeline import CONFIG, load_and_preprocess, keyword_totals, generate_category_summary
+from tracing import tracer, trace_path_for
+
+LOG_PATH = CONFIG["LOG_PATH"]
+TRACE_PATH = trace_path_for(LOG_PATH)
+EXCEL_EXTS = (".xlsx", ".xls")
+
+logger = logging.getLogger(__name__)
+
+# ===============================
+# 입력 파일 수집
+# ===============================
+def collect_files(targets: list) -> list:
+    """디렉터리/글롭/파일 경로 목록을 엑셀 파일 경로 목록으로 펼친다"""
+    files = []
+    for target in targets:
+        if os.path.isdir(target):
+            matches = [os.path.join(target, name) for name in os.listdir(target)]
+        else:
+            matches = glob.glob(target)
+        files.extend(p for p in matches
+                     if os.path.isfile(p) and p.lower().endswith(EXCEL_EXTS))
+    # 중복 제거 + 정렬 (실행마다 같은 순서)
+    return sorted(set(files))
+
+# ===============================
+# 워커 (프로세스 풀에서 실행)
+# ===============================
+def process_file(path: str):
+    """파일 하나를 로드/전처리하고 (경로, DataFrame, 소요시간) 반환"""
+    tracer.configure(TRACE_PATH)
+    start = time.perf_counter()
+    with tracer.run("batch"):
+        df = load_and_preprocess(path)
+    return path, df, time.perf_counter() - start
+
+# ===============================
+# 실행부
+# ===============================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m batch", description="명세서 일괄 분석")
+    parser.add_argument("targets", nargs="+", help="명세서 디렉터리, 글롭 패턴 또는 파일 경로")
+    parser.add_argument("-k", "--keywords", default="", help="쉼표로 구분한 가맹점 키워드")
+    parser.add_argument("-o", "--out-dir", default=".", help="CSV 저장 디렉터리")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    return parser.parse_args(argv)
+
+def run_batch(files: list, keywords: list, out_dir: str, jobs=None) -> dict:
+    """파일들을 병렬 처리하고 결과 CSV 경로와 통계를 반환"""
+    start = time.perf_counter()
+    frames, failed = {}, []
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(process_file, p): p for p in files}
+        for fut in as_completed(futures):
+            path = futures[fut]
+            try:
+                _, df, elapsed = fut.result()
+            except Exception as e:
+                logger.exception("파일 처리 실패: %s", path)
+                failed.append(path)
+                print(f"[실패] {path}: {e}", file=sys.stderr)
+                continue
+            frames[path] = df
+            rate = len(df) / elapsed if elapsed > 0 else 0.0
+            profile = df.attrs.get("profile", "-")
+            print(f"[완료] {path}: {len(df):,}행, 형식 '{profile}', {elapsed:.2f}s ({rate:,.0f}행/s)")
+
+    if not frames:
+        raise RuntimeError("처리된 파일이 없습니다.")
+
+    combined = pd.concat([frames[p] for p in files if p in frames], ignore_index=True)
+    totals = keyword_totals(combined, keywords)
+    summary = generate_category_summary(combined)
+
+    os.makedirs(out_dir, exist_ok=True)
+    now = pd.Timestamp.now().strftime("%Y%m%d_%H%M")
+    kw_text = "_".join(keywords) if keywords else "전체"
+    totals_path = os.path.join(out_dir, f"{kw_text}_키워드_합계_{now}.csv")
+    summary_path = os.path.join(out_dir, f"카테고리_요약_{now}.csv")
+    totals.to_csv(totals_path, encoding="utf-8-sig", index=False)
+    summary.to_csv(summary_path, encoding="utf-8-sig", index=False)
+
+    elapsed = time.perf_counter() - start
+    rows = len(combined)
+    logger.info("일괄 분석 완료: 파일 %d개(실패 %d), %d행, %.2fs",
+                len(frames), len(failed), rows, elapsed)
+    return {
+        "files": len(frames),
+        "failed": failed,
+        "rows": rows,
+        "elapsed": elapsed,
+        "rows_per_sec": rows / elapsed if elapsed > 0 else 0.0,
+        "totals_path": totals_path,
+        "summary_path": summary_path,
+    }
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        filename=LOG_PATH,
+        filemode="a",
+    )
+    args = parse_args(argv)
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+
+    files = collect_files(args.targets)
+    if not files:
+        print("처리할 엑셀 파일이 없습니다.", file=sys.stderr)
+        return 1
+
+    try:
+        result = run_batch(files, keywords, args.out_dir, args.jobs)
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    print(f"총 {result['files']}개 파일, {result['rows']:,}행, {result['elapsed']:.2f}s "
+          f"({result['rows_per_sec']:,.0f}행/s)")
+    print(f"키워드 합계: {result['totals_path']}")
+    print(f"카테고리 요약: {result['summary_path']}")
+    return 1 if result["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+전처리 결과 캐시
+--------------------------------
+전처리된 DataFrame(DT, _is_tx 포함)을 Arrow IPC 파일로 저장해 두고,
+같은 파일을 다시 열 때 엑셀 파싱/전처리 대신 memory-map 읽기로 대체한다.
+
+- 키: 파일 내용 해시 + 설정 지문(컬럼명, DATE_COL_KEYS, CATEGORY_MAP, 형식 프로필, 압축 설정, 파이프라인 버전)
+- 경로/크기/mtime이 그대로면 내용 해시를 다시 계산하지 않는다.
+- 전체 크기가 CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)
+- pyarrow가 없으면 캐시 없이 동작한다.
+"""
+
+import os, json, time, hashlib, logging, threading
+import pandas as pd
+
+from pipeline import (
+    COL_STORE, COL_AMOUNT, COL_DT, DATE_COL_KEYS, CATEGORY_MAP, PIPELINE_VERSION, COMPACT_FRAME, DISPLAY_COLUMNS,
+    LOAD_STAGES, report_progress, load_and_preprocess,
+)
+from profiles import profiles_fingerprint
+from tracing import tracer
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+HASH_CHUNK = 1024 * 1024
+
+def config_fingerprint() -> str:
+    """전처리 결과에 영향을 주는 설정의 지문 (바뀌면 기존 캐시는 모두 무효)"""
+    payload = json.dumps({
+        "COL_STORE": COL_STORE,
+        "COL_AMOUNT": COL_AMOUNT,
+        "COL_DT": COL_DT,
+        "DATE_COL_KEYS": DATE_COL_KEYS,
+        "CATEGORY_MAP": CATEGORY_MAP,
+        "PIPELINE_VERSION": PIPELINE_VERSION,
+        "STATEMENT_PROFILES": profiles_fingerprint(),
+        "COMPACT_FRAME": COMPACT_FRAME,
+        "DISPLAY_COLUMNS": DISPLAY_COLUMNS,
+    }, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def file_content_hash(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow로 변환할 수 없는 혼합 타입 object 컬럼은 문자열 컬럼으로 바꾼다"""
+    fixed = {}
+    for col in df.columns:
+        if df[col].dtype == object:
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fixed[col] = df[col].astype("string")
+    return df.assign(**fixed) if fixed else df
+
+class StatementCache:
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fingerprint = config_fingerprint()
+        self._lock = threading.Lock()
+        self._index = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "StatementCache":
+        cache_dir = config.get("CACHE_DIR", ".cache")
+        max_mb = config.get("CACHE_MAX_MB", 512)
+        return cls(cache_dir, int(max_mb * 1024 * 1024))
+
+    @property
+    def enabled(self) -> bool:
+        return feather is not None and self.max_bytes > 0
+
+    # --------------------------
+    # 인덱스 (index.json)
+    # --------------------------
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, INDEX_NAME)
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {"files": {}, "entries": {}}
+            if os.path.exists(self._index_path()):
+                try:
+                    with open(self._index_path(), "r", encoding="utf-8") as f:
+                        self._index = json.load(f)
+                except (OSError, ValueError):
+                    logger.warning("캐시 인덱스를 읽을 수 없어 새로 만듭니다: %s", self._index_path())
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self._index_path() + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(tmp, self._index_path())
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".arrow")
+
+    def cache_key(self, path: str, content_hash: str = None) -> str:
+        """캐시 키 계산 (content_hash를 주지 않으면 경로/크기/mtime이 같을 때 저장된 해시를 재사용)
+
+        파일 해시는 락 밖에서 계산하므로 큰 파일을 해시하는 동안 다른 파일의 캐시 조회가 막히지 않는다
+        """
+        st = os.stat(path)
+        abspath = os.path.abspath(path)
+        if content_hash is None:
+            with self._lock:
+                known = self._load_index()["files"].get(abspath)
+            if known and known["size"] == st.st_size and known["mtime"] == st.st_mtime:
+                content_hash = known["hash"]
+            else:
+                content_hash = file_content_hash(path)
+        with self._lock:
+            self._load_index()["files"][abspath] = {"size": st.st_size, "mtime": st.st_mtime, "hash": content_hash}
+        return hashlib.sha1((content_hash + self.fingerprint).encode("ascii")).hexdigest()
+
+    # --------------------------
+    # 조회 / 저장
+    # --------------------------
+    def get(self, key: str):
+        entries = self._load_index()["entries"]
+        if key not in entries:
+            return None
+        try:
+            table = feather.read_table(self._entry_path(key), memory_map=True)
+            df = table.to_pandas()
+            # 키에 CATEGORY_MAP 지문이 포함되어 있으므로 저장 이후 직접 지정이 바뀐 경우에만
+            # ensure_categories가 카테고리 컬럼을 다시 계산한다
+            df.attrs["category_version"] = entries[key].get("category_version")
+        except (OSError, pa.ArrowInvalid):
+            logger.warning("손상된 캐시 항목 삭제: %s", key)
+            self._remove(key)
+            return None
+        entries[key]["last_used"] = time.time()
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        try:
+            feather.write_feather(arrow_safe(df), path, compression="uncompressed")
+        except (OSError, ValueError, pa.ArrowException):
+            logger.exception("캐시 저장 실패: %s", key)
+            return
+        self._load_index()["entries"][key] = {"bytes": os.path.getsize(path), "last_used": time.time(),
+                                              "category_version": df.attrs.get("category_version")}
+        self._evict()
+
+    def _remove(self, key: str):
+        self._load_index()["entries"].pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """최대 크기를 넘으면 last_used가 오래된 항목부터 삭제"""
+        entries = self._load_index()["entries"]
+        total = sum(e["bytes"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["bytes"]
+            self._remove(key)
+            logger.info("캐시 항목 제거(LRU): %s", key)
+
+    # --------------------------
+    # 파이프라인 연동
+    # --------------------------
+    def load_and_preprocess(self, path: str, progress=None, content_hash: str = None) -> pd.DataFrame:
+        """캐시에 있으면 바로 반환, 없으면 엑셀을 읽어 전처리한 뒤 저장
+
+        호출하는 쪽에서 이미 파일 해시를 계산했다면 content_hash로 넘겨 다시 읽지 않게 한다
+        """
+        if not self.enabled:
+            return load_and_preprocess(path, progress)
+
+        with tracer.stage("캐시 조회") as st:
+            key = self.cache_key(path, content_hash)
+            start = time.perf_counter()
+            with self._lock:
+                df = self.get(key)
+                if df is not None:
+                    self._save_index()
+                    st.set_output(df)
+        if df is not None:
+            logger.info("캐시 적중: %s (%.3fs)", path, time.perf_counter() - start)
+            for stage in LOAD_STAGES:
+                report_progress(progress, stage)
+            return df
+
+        df = load_and_preprocess(path, progress)
+        with self._lock, tracer.stage("캐시 저장", rows_in=len(df)):
+            self.put(key, df)
+            self._save_index()
+        return df
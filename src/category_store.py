@@ -0,0 +1,180 @@
+"""
+가맹점 → 카테고리 색인
+--------------------------------
+정리된 가맹점명마다 분류 결과를 SQLite 파일(CATEGORY_INDEX_PATH)에 저장해 두고 다시 쓴다.
+
+- 이미 분류한 가맹점은 메모리 dict 조회로 끝나고, 처음 보는 가맹점만 키워드 매처를 거친다
+- 항목마다 그 결과를 만든 CATEGORY_MAP 지문(version)을 기록한다
+- CATEGORY_MAP이 바뀌면 이전 규칙과 비교해 (카테고리, 순서)가 달라진 키워드를 포함한 가맹점만 다시 분류하고
+  나머지는 지문만 새 것으로 바꾼다
+- 화면에서 지정한 카테고리(override)는 규칙이 바뀌어도 그대로 두고, 지정할 때마다 revision이 오른다
+"""
+
+import json, time, hashlib, logging, sqlite3, threading
+
+from matcher import KeywordMatcher, category_matcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATEGORY = "기타"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS merchants (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    version TEXT NOT NULL,
+    override INTEGER NOT NULL DEFAULT 0,
+    updated REAL
+);
+CREATE TABLE IF NOT EXISTS rule_sets (
+    version TEXT PRIMARY KEY,
+    rules TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def rules_version(category_map: dict) -> str:
+    """CATEGORY_MAP 내용의 지문"""
+    payload = json.dumps(category_map, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def keyword_rules(category_map: dict) -> dict:
+    """소문자 키워드 → ((카테고리 순서, 카테고리), ...) (분류 결과를 정하는 정보)"""
+    rules = {}
+    for pos, (cat, keywords) in enumerate(category_map.items()):
+        for kw in keywords:
+            rules.setdefault(kw.lower(), set()).add((pos, cat))
+    return {kw: tuple(sorted(v)) for kw, v in rules.items()}
+
+def changed_keywords(old_map: dict, new_map: dict) -> list:
+    """추가/삭제되었거나 카테고리/순서가 바뀐 키워드"""
+    old, new = keyword_rules(old_map), keyword_rules(new_map)
+    return sorted(kw for kw in old.keys() | new.keys() if old.get(kw) != new.get(kw))
+
+class CategoryIndex:
+    def __init__(self, path: str, category_map: dict):
+        self.path = path
+        self.category_map = category_map
+        self.categories = set(category_map) | {DEFAULT_CATEGORY}
+        self.version = rules_version(category_map)
+        self._matcher = category_matcher(category_map)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._entries = {
+            name: (category, version, bool(override))
+            for name, category, version, override in
+            self._conn.execute("SELECT name, category, version, override FROM merchants")
+        }
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'override_revision'").fetchone()
+        self.override_revision = int(row[0]) if row else 0
+        self.sync()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _classify(self, name: str) -> str:
+        return self._matcher.first_label(name, DEFAULT_CATEGORY)
+
+    def _store(self, rows: list):
+        """[(이름, 카테고리, 지문, override)]를 메모리와 파일에 함께 기록"""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO merchants (name, category, version, override, updated) VALUES (?, ?, ?, ?, ?)",
+                [(n, c, v, int(o), now) for n, c, v, o in rows])
+        for n, c, v, o in rows:
+            self._entries[n] = (c, v, o)
+
+    # --------------------------
+    # 규칙 변경 반영
+    # --------------------------
+    def sync(self) -> int:
+        """이전 CATEGORY_MAP으로 분류된 항목 중 바뀐 규칙에 걸리는 것만 다시 분류하고 그 수를 반환"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO rule_sets (version, rules) VALUES (?, ?)",
+                                   (self.version, json.dumps(self.category_map, ensure_ascii=False)))
+            stale = {}
+            for name, (_, version, override) in self._entries.items():
+                if not override and version != self.version:
+                    stale.setdefault(version, []).append(name)
+            if not stale:
+                return 0
+
+            rows, reclassified = [], 0
+            for version, names in stale.items():
+                found = self._conn.execute("SELECT rules FROM rule_sets WHERE version = ?", (version,)).fetchone()
+                if found is None:
+                    affected = set(names)       # 이전 규칙을 모르면 전부 다시 분류
+                else:
+                    probe = KeywordMatcher(changed_keywords(json.loads(found[0]), self.category_map))
+                    affected = {n for n in names if probe.find_indices(n)}
+                reclassified += len(affected)
+                for n in names:
+                    category = self._classify(n) if n in affected else self._entries[n][0]
+                    rows.append((n, category, self.version, False))
+            self._store(rows)
+            with self._conn:
+                self._conn.execute("DELETE FROM rule_sets WHERE version != ? AND version NOT IN "
+                                   "(SELECT DISTINCT version FROM merchants)", (self.version,))
+            logger.info("카테고리 색인 규칙 갱신: 이전 규칙 항목 %d개 중 %d개 재분류", len(rows), reclassified)
+            return reclassified
+
+    # --------------------------
+    # 조회
+    # --------------------------
+    def resolve(self, names: list) -> list:
+        """가맹점명 목록의 카테고리 (처음 보는 가맹점만 분류해 저장)"""
+        with self._lock:
+            out, new_rows = [], []
+            for name in names:
+                entry = self._entries.get(name)
+                if entry is not None and (entry[2] or entry[1] == self.version) and entry[0] in self.categories:
+                    out.append(entry[0])
+                    continue
+                category = self._classify(name)
+                out.append(category)
+                if entry is None or not entry[2]:
+                    new_rows.append((name, category, self.version, False))
+            if new_rows:
+                self._store(new_rows)
+                logger.info("카테고리 색인: 새 가맹점 %d개 분류 (전체 %d개)", len(new_rows), len(self._entries))
+            return out
+
+    def category_of(self, name: str) -> tuple:
+        """(카테고리, 직접 지정 여부)"""
+        category = self.resolve([name])[0]
+        return category, self._entries.get(name, (None, None, False))[2]
+
+    # --------------------------
+    # 직접 지정
+    # --------------------------
+    def _bump_revision(self):
+        self.override_revision += 1
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('override_revision', ?)",
+                               (str(self.override_revision),))
+
+    def set_override(self, name: str, category: str):
+        if category not in self.categories:
+            raise ValueError(f"알 수 없는 카테고리입니다: {category}")
+        with self._lock:
+            self._store([(name, category, self.version, True)])
+            self._bump_revision()
+        logger.info("카테고리 직접 지정: %s → %s", name, category)
+
+    def clear_override(self, name: str):
+        """직접 지정을 지우고 규칙에 따른 분류로 되돌린다"""
+        with self._lock:
+            self._store([(name, self._classify(name), self.version, False)])
+            self._bump_revision()
+        logger.info("카테고리 직접 지정 해제: %s", name)
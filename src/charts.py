@@ -0,0 +1,215 @@
+"""
+차트 창 관리
+--------------------------------
+차트 종류마다 Figure/캔버스를 하나만 만들어 두고, 데이터가 바뀌면 그 창을 갱신한다.
+
+- 막대 개수와 라벨이 같으면 막대 높이만 바꾸고 막대만 다시 그린다 (blit)
+- 라벨/개수나 y축 범위가 바뀌면 그 창의 축만 다시 만든다
+- 창을 닫으면 관리 목록에서 빠지고 위젯(과 Figure)이 삭제된다
+matplotlib은 이 모듈을 처음 쓸 때 import 된다 (main.py는 차트를 열 때 이 모듈을 불러온다).
+"""
+
+import math
+from functools import lru_cache
+import numpy as np
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView
+
+MAX_TICKS = 24
+Y_MARGIN = 1.05
+
+@lru_cache(maxsize=1)
+def load_matplotlib():
+    """matplotlib을 import 하고 한글 폰트를 설정"""
+    import matplotlib
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    from matplotlib.figure import Figure
+
+    matplotlib.rcParams['font.family'] = 'Malgun Gothic'  # Windows
+    matplotlib.rcParams['axes.unicode_minus'] = False     # 마이너스 깨짐 방지
+    return FigureCanvasQTAgg, Figure
+
+# ===============================
+# 창
+# ===============================
+class ManagedWindow(QWidget):
+    """닫히면 closed(kind)를 보내고 스스로 삭제되는 창"""
+    closed = Signal(str)
+
+    def __init__(self, kind: str):
+        super().__init__()
+        self.kind = kind
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+    def closeEvent(self, event):
+        self.closed.emit(self.kind)
+        super().closeEvent(event)
+
+class BarChartWindow(ManagedWindow):
+    """(누적) 막대 차트 하나를 계속 갱신하는 창"""
+
+    def __init__(self, kind: str):
+        super().__init__(kind)
+        FigureCanvas, Figure = load_matplotlib()
+        self.figure = Figure(figsize=(6, 4))
+        self.canvas = FigureCanvas(self.figure)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.canvas)
+        self.ax = self.figure.add_subplot(111)
+
+        self._containers = []       # 스택마다 BarContainer (막대는 animated → blit 대상)
+        self._labels = None
+        self._names = None
+        self._background = None
+        self.full_draws = 0
+        self.blits = 0
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # --------------------------
+    # 그리기
+    # --------------------------
+    def _on_draw(self, event):
+        """전체 그리기 직후: 막대를 뺀 배경을 저장하고 막대를 얹는다"""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_bars()
+
+    def _draw_bars(self):
+        for container in self._containers:
+            for rect in container.patches:
+                self.ax.draw_artist(rect)
+
+    def _blit(self):
+        if self._background is None:
+            self._full_draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_bars()
+        self.canvas.blit(self.ax.bbox)
+        self.blits += 1
+
+    def _full_draw(self):
+        self.canvas.draw_idle()
+        self.full_draws += 1
+
+    @staticmethod
+    def _y_range(stacks) -> tuple:
+        if not stacks or not len(stacks[0][1]):
+            return 0.0, 1.0
+        cumulative = np.cumsum(np.vstack([v for _, v in stacks]), axis=0)
+        lo = min(0.0, float(cumulative.min()))
+        hi = max(0.0, float(cumulative.max()))
+        return lo * Y_MARGIN, (hi * Y_MARGIN) or 1.0
+
+    # --------------------------
+    # 갱신
+    # --------------------------
+    def set_bars(self, title: str, labels, stacks, rotation: int = 0):
+        """labels 순서의 막대를 stacks [(이름, 값 배열), ...]로 그린다 (스택이 여럿이면 누적)"""
+        labels = [str(l) for l in labels]
+        stacks = [(name, np.asarray(values, dtype=np.float64)) for name, values in stacks]
+        names = [name for name, _ in stacks]
+        lo, hi = self._y_range(stacks)
+
+        if labels == self._labels and names == self._names:
+            bottom = np.zeros(len(labels))
+            for container, (_, values) in zip(self._containers, stacks):
+                for rect, b, v in zip(container.patches, bottom, values):
+                    rect.set_y(b)
+                    rect.set_height(v)
+                bottom = bottom + values
+            cur_lo, cur_hi = self.ax.get_ylim()
+            # 범위를 벗어나거나 절반 이하로 줄면 축(눈금)도 다시 그린다
+            if lo < cur_lo or hi > cur_hi or hi < cur_hi / 2 or self.ax.get_title() != title:
+                self.ax.set_title(title)
+                self.ax.set_ylim(lo, hi)
+                self._full_draw()
+            else:
+                self._blit()
+            return
+
+        for container in self._containers:
+            container.remove()
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+        x = np.arange(len(labels))
+        bottom = np.zeros(len(labels))
+        self._containers = []
+        for name, values in stacks:
+            self._containers.append(self.ax.bar(x, values, bottom=bottom, label=name, animated=True))
+            bottom = bottom + values
+        step = max(1, math.ceil(len(labels) / MAX_TICKS))
+        self.ax.set_xticks(x[::step], labels[::step], rotation=rotation)
+        self.ax.set_xlim(-0.6, len(labels) - 0.4)
+        self.ax.set_ylim(lo, hi)
+        self.ax.set_title(title)
+        if len(stacks) > 1:
+            self.ax.legend(fontsize="small")
+        self._labels = labels
+        self._names = names
+        self.figure.tight_layout()
+        self._full_draw()
+
+class TableWindow(ManagedWindow):
+    def __init__(self, kind: str):
+        from table_model import DataFrameTableModel
+
+        super().__init__(kind)
+        self.resize(480, 360)
+        layout = QVBoxLayout(self)
+        self.view = QTableView()
+        self.model = DataFrameTableModel(self)
+        self.view.setModel(self.model)
+        self.view.setSortingEnabled(True)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.view)
+
+    def set_frame(self, df, amount_cols=()):
+        self.model.set_frame(df, list(df.columns), amount_cols=amount_cols)
+
+# ===============================
+# 관리자
+# ===============================
+class ChartManager:
+    """차트 종류(kind)별로 열린 창 하나를 유지"""
+
+    def __init__(self):
+        self.windows = {}
+
+    def open_kinds(self) -> list:
+        return list(self.windows)
+
+    def _window(self, kind: str, cls):
+        win = self.windows.get(kind)
+        if win is None:
+            win = cls(kind)
+            win.closed.connect(self._release)
+            self.windows[kind] = win
+        return win
+
+    def _release(self, kind: str):
+        self.windows.pop(kind, None)
+
+    def _present(self, win, title: str, activate: bool):
+        win.setWindowTitle(title)
+        if activate:
+            win.show()
+            win.raise_()
+
+    def bar_chart(self, kind: str, window_title: str, title: str, labels, stacks,
+                  rotation: int = 0, activate: bool = True) -> BarChartWindow:
+        win = self._window(kind, BarChartWindow)
+        win.set_bars(title, labels, stacks, rotation)
+        self._present(win, window_title, activate)
+        return win
+
+    def table(self, kind: str, window_title: str, df, amount_cols=(), activate: bool = True) -> TableWindow:
+        win = self._window(kind, TableWindow)
+        win.set_frame(df, amount_cols)
+        self._present(win, window_title, activate)
+        return win
+
+    def close_all(self):
+        for win in list(self.windows.values()):
+            win.close()
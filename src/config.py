@@ -0,0 +1,35 @@
+"""
+설정 파일 로드
+--------------------------------
+config.json은 import 시점이 아니라 get_config()를 처음 호출할 때 한 번 읽는다.
+
+찾는 순서
+1. 환경 변수 EXCEL_ANALYZER_CONFIG에 지정한 경로
+2. 현재 작업 디렉터리의 config.json (기존 동작)
+3. 프로그램 폴더(src의 상위)의 config.json
+"""
+
+import os, json
+from functools import lru_cache
+
+CONFIG_ENV = "EXCEL_ANALYZER_CONFIG"
+CONFIG_NAME = "config.json"
+
+def config_candidates() -> list:
+    paths = []
+    if os.environ.get(CONFIG_ENV):
+        paths.append(os.environ[CONFIG_ENV])
+    paths.append(os.path.join(os.getcwd(), CONFIG_NAME))
+    paths.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), CONFIG_NAME))
+    return paths
+
+def find_config() -> str:
+    for path in config_candidates():
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"{CONFIG_NAME}을 찾을 수 없습니다: " + ", ".join(config_candidates()))
+
+@lru_cache(maxsize=1)
+def get_config() -> dict:
+    with open(find_config(), "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,168 @@
+"""
+기간 집계 큐브
+--------------------------------
+실제 거래(_is_tx, 날짜 있음)를 (일, 카테고리, 가맹점) 칸으로 미리 합산해 둔다.
+
+- 일 단위 기간은 1970-01-01부터의 일수(정수)로, 카테고리/가맹점은 정수 코드로 저장한다
+- 월/주/일 차트, 카테고리×월 표, 상위 가맹점 표는 행이 아닌 칸을 다시 묶어 만든다
+- 새 행이 들어오면 그 행들만 칸으로 묶어 기존 칸에 더한다 (누적 모드)
+"""
+
+import numpy as np
+import pandas as pd
+
+from pipeline import COL_STORE, COL_AMOUNT, COL_DT, COL_CATEGORY, ensure_categories, category_map_version
+
+PERIODS = ("day", "week", "month")
+COL_PERIOD = "기간"
+COL_COUNT = "건수"
+
+_LEVELS = ["day", "cat", "merchant"]
+
+def period_codes(days: np.ndarray, freq: str) -> np.ndarray:
+    """일 코드를 주/월 코드로 (주는 월요일 시작, 1970-01-01은 목요일)"""
+    if freq == "day":
+        return days
+    if freq == "week":
+        return (days + 3) // 7
+    if freq == "month":
+        return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    raise ValueError(f"지원하지 않는 기간 단위입니다: {freq}")
+
+def period_starts(codes: np.ndarray, freq: str) -> np.ndarray:
+    """기간 코드 → 기간 시작일 (datetime64[ns])"""
+    if freq == "day":
+        days = codes.astype("datetime64[D]")
+    elif freq == "week":
+        days = (codes * 7 - 3).astype("datetime64[D]")
+    else:
+        days = codes.astype("datetime64[M]").astype("datetime64[D]")
+    return days.astype("datetime64[ns]")
+
+class SpendingCube:
+    def __init__(self):
+        self.cells = self._empty_cells()
+        self.categories = []        # 카테고리 코드 → 이름
+        self.merchants = []         # 가맹점 코드 → 이름
+        self._category_codes = {}
+        self._merchant_codes = {}
+        self.rows = 0
+        self.category_version = category_map_version()
+        self._rollups = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SpendingCube":
+        cube = cls()
+        cube.update(df)
+        return cube
+
+    @staticmethod
+    def _empty_cells() -> pd.DataFrame:
+        index = pd.MultiIndex.from_arrays([np.array([], dtype=np.int64)] * 3, names=_LEVELS)
+        return pd.DataFrame({COL_AMOUNT: np.array([], dtype=np.float64),
+                             COL_COUNT: np.array([], dtype=np.int64)}, index=index)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def is_stale(self) -> bool:
+        """CATEGORY_MAP이 바뀌어 카테고리 코드를 다시 만들어야 하는지"""
+        return self.category_version != category_map_version()
+
+    # --------------------------
+    # 갱신
+    # --------------------------
+    @staticmethod
+    def _encode(values: pd.Series, vocab: list, codes: dict) -> np.ndarray:
+        """값을 고유값 단위로 전역 코드에 매핑 (처음 보는 값은 새 코드)"""
+        local, uniques = pd.factorize(values, use_na_sentinel=False)
+        mapping = np.empty(len(uniques), dtype=np.int64)
+        for i, u in enumerate(uniques):
+            key = str(u)
+            code = codes.get(key)
+            if code is None:
+                code = codes[key] = len(vocab)
+                vocab.append(key)
+            mapping[i] = code
+        return mapping[local]
+
+    def update(self, df: pd.DataFrame) -> int:
+        """새 행을 칸으로 묶어 더하고 반영한 거래 수를 반환"""
+        df = ensure_categories(df)
+        valid = df[COL_DT].notna().to_numpy()
+        if "_is_tx" in df.columns:
+            valid &= df["_is_tx"].to_numpy(dtype=bool)
+        if not valid.any():
+            return 0
+
+        # 카테고리 코드는 CATEGORY_MAP 순서를 따르도록 먼저 등록해 둔다
+        categories = df[COL_CATEGORY].dtype.categories if isinstance(df[COL_CATEGORY].dtype, pd.CategoricalDtype) else []
+        for name in categories:
+            if name not in self._category_codes:
+                self._category_codes[name] = len(self.categories)
+                self.categories.append(name)
+
+        days = df[COL_DT].to_numpy()[valid].astype("datetime64[D]").astype(np.int64)
+        delta = pd.DataFrame({
+            "day": days,
+            "cat": self._encode(df[COL_CATEGORY][valid], self.categories, self._category_codes),
+            "merchant": self._encode(df[COL_STORE][valid], self.merchants, self._merchant_codes),
+            COL_AMOUNT: df[COL_AMOUNT].to_numpy(dtype=np.float64)[valid],
+        }).groupby(_LEVELS, sort=False)[COL_AMOUNT].agg(["sum", "size"])
+        delta.columns = [COL_AMOUNT, COL_COUNT]
+
+        if len(self.cells):
+            self.cells = pd.concat([self.cells, delta]).groupby(level=_LEVELS, sort=False).sum()
+        else:
+            self.cells = delta
+        self.rows += int(valid.sum())
+        self._rollups.clear()
+        return int(valid.sum())
+
+    # --------------------------
+    # 롤업 (결과는 다음 갱신 전까지 재사용)
+    # --------------------------
+    def _cached(self, key, build):
+        if key not in self._rollups:
+            self._rollups[key] = build()
+        return self._rollups[key]
+
+    def _level(self, name: str) -> np.ndarray:
+        return self.cells.index.get_level_values(name).to_numpy()
+
+    def by_period(self, freq: str = "month") -> pd.DataFrame:
+        """기간별 합계/건수 (기간 = 기간 시작일, 오름차순)"""
+        def build():
+            codes = period_codes(self._level("day"), freq)
+            grouped = self.cells.groupby(codes).sum()
+            return pd.DataFrame({
+                COL_PERIOD: period_starts(grouped.index.to_numpy(), freq),
+                COL_AMOUNT: grouped[COL_AMOUNT].to_numpy(),
+                COL_COUNT: grouped[COL_COUNT].to_numpy(),
+            })
+        return self._cached(("period", freq), build)
+
+    def category_by_period(self, freq: str = "month") -> pd.DataFrame:
+        """행 = 기간 시작일, 열 = 카테고리인 합계 표 (없는 칸은 0)"""
+        def build():
+            codes = period_codes(self._level("day"), freq)
+            table = self.cells[COL_AMOUNT].groupby([codes, self._level("cat")]).sum().unstack(fill_value=0)
+            table.index = pd.DatetimeIndex(period_starts(table.index.to_numpy(), freq), name=COL_PERIOD)
+            table.columns = pd.Index([self.categories[c] for c in table.columns], name=COL_CATEGORY)
+            return table
+        return self._cached(("category", freq), build)
+
+    def top_merchants(self, n: int = 10, category: str = None) -> pd.DataFrame:
+        """합계 상위 가맹점 (category를 주면 그 카테고리 안에서)"""
+        def build():
+            cells = self.cells
+            if category is not None:
+                code = self._category_codes.get(category)
+                cells = cells[self._level("cat") == code]
+            grouped = cells.groupby(level="merchant").sum().nlargest(n, COL_AMOUNT)
+            return pd.DataFrame({
+                COL_STORE: [self.merchants[c] for c in grouped.index],
+                COL_AMOUNT: grouped[COL_AMOUNT].to_numpy(),
+                COL_COUNT: grouped[COL_COUNT].to_numpy(),
+            })
+        return self._cached(("top", n, category), build)
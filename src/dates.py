@@ -0,0 +1,129 @@
+"""
+날짜 컬럼 파싱
+--------------------------------
+컬럼 앞부분을 표본으로 형식을 한 번 판별한 뒤, 그 형식으로 전체를 한 번에 변환한다.
+
+- 엑셀 날짜 일련번호 (45300 → 2024-01-08), yyyymmdd 정수
+- yy.mm.dd / yyyy-mm-dd / yyyy/mm/dd 등 구분자 조합, 한글 년월일
+- 위 형식 뒤에 붙은 시:분(:초)
+- 엑셀이 날짜로 저장한 셀(datetime 객체)은 문자열 형식 판별 전에 그대로 변환한다
+한 컬럼에 형식이 섞여 있으면 남은 행으로 다시 판별하고, 새로 파싱되는 행이 없을 때까지 반복한다.
+끝까지 파싱되지 않은 행 수는 경고 로그로 남긴다.
+"""
+
+import datetime, logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_SIZE = 200
+
+# 엑셀 일련번호로 볼 범위 (1927 ~ 2119년), yyyymmdd 정수 범위
+SERIAL_MIN, SERIAL_MAX = 10_000, 80_000
+YMD_MIN, YMD_MAX = 19_000_101, 21_001_231
+
+def _candidate_formats() -> list:
+    dates = []
+    for year in ("%Y", "%y"):
+        for sep in (".", "-", "/"):
+            dates.append(f"{year}{sep}%m{sep}%d")
+        dates.append(f"{year}년 %m월 %d일")
+        dates.append(f"{year}년%m월%d일")
+    dates.append("%Y%m%d")
+    return [d + t for d in dates for t in ("", " %H:%M", " %H:%M:%S")]
+
+DATE_FORMATS = _candidate_formats()
+
+def sample_values(values: pd.Series) -> pd.Series:
+    """컬럼 전체에 고르게 퍼진 표본 (앞쪽 안내문/합계 행에 치우치지 않도록)"""
+    step = max(1, len(values) // SAMPLE_SIZE)
+    return values.iloc[::step].head(SAMPLE_SIZE)
+
+def detect_format(sample: pd.Series):
+    """표본에서 가장 많이 파싱되는 형식과 그 비율 (하나도 안 되면 (None, 0.0))"""
+    best_fmt, best_rate = None, 0.0
+    for fmt in DATE_FORMATS:
+        rate = pd.to_datetime(sample, format=fmt, errors="coerce").notna().mean()
+        if rate > best_rate:
+            best_fmt, best_rate = fmt, rate
+            if rate == 1.0:
+                break
+    return best_fmt, best_rate
+
+def _parse_numeric(values: pd.Series) -> tuple:
+    out = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    serial = values.between(SERIAL_MIN, SERIAL_MAX)
+    if serial.any():
+        out[serial] = pd.to_datetime(values[serial].astype("float64"), unit="D", origin="1899-12-30")
+    ymd = values.between(YMD_MIN, YMD_MAX) & (values % 1 == 0)
+    if ymd.any():
+        out[ymd] = pd.to_datetime(values[ymd].astype("int64").astype(str), format="%Y%m%d", errors="coerce")
+    how = "엑셀 일련번호" if serial.sum() >= ymd.sum() else "yyyymmdd"
+    return out, how
+
+def _parse_strings(values: pd.Series) -> tuple:
+    # 결과는 위치로 채운다 (인덱스 라벨로 맞추면 행 수만큼의 해시 테이블과 정렬 복사가 생긴다)
+    out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    used = []
+
+    # 날짜 셀(datetime/Timestamp/date)은 문자열로 바꾸지 않고 바로 변환 (형식 판별 대상에서 제외)
+    is_dt = values.map(lambda v: isinstance(v, (datetime.date, pd.Timestamp))).to_numpy(dtype=bool)
+    if is_dt.any():
+        out[is_dt] = pd.to_datetime(values[is_dt], errors="coerce").to_numpy(dtype="datetime64[ns]")
+        used.append("datetime")
+        pos = np.flatnonzero(~is_dt)
+        remaining = values.iloc[pos]
+    else:
+        pos = np.arange(len(values))
+        remaining = values
+    if pd.api.types.infer_dtype(remaining, skipna=False) != "string":
+        remaining = remaining.astype(str)
+    remaining = remaining.str.strip()
+
+    # 새로 파싱되는 행이 있는 동안 남은 행으로 형식을 다시 판별
+    while not remaining.empty:
+        fmt, rate = detect_format(sample_values(remaining))
+        if fmt is None:
+            break
+        parsed = pd.to_datetime(remaining, format=fmt, errors="coerce").to_numpy()
+        ok = ~np.isnat(parsed)
+        if not ok.any():
+            break
+        if ok.all():
+            out[pos] = parsed
+            remaining = remaining.iloc[:0]
+        else:
+            out[pos[ok]] = parsed[ok]
+            pos = pos[~ok]
+            remaining = remaining.iloc[np.flatnonzero(~ok)]
+        used.append(fmt)
+
+    if used and not remaining.empty:
+        logger.warning("날짜로 해석하지 못한 행 %d개 (형식: %s, 예: %r)",
+                       len(remaining), ", ".join(used), remaining.iloc[0])
+    return pd.Series(out, index=values.index), ", ".join(used) or "형식 없음"
+
+def parse_date_column(s: pd.Series) -> tuple:
+    """컬럼 하나를 datetime64 Series로 변환하고 (결과, 판별한 형식 설명) 반환"""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.astype("datetime64[ns]"), "datetime"
+    if pd.api.types.is_numeric_dtype(s):
+        return _parse_numeric(s)
+
+    present = s.notna().to_numpy()
+    if not present.any():
+        return pd.Series(pd.NaT, index=s.index, dtype="datetime64[ns]"), "빈 컬럼"
+    # 빈 셀이 없으면 (대부분의 명세서) 컬럼을 복사하지 않고 그대로 파싱한다
+    values = s if present.all() else s[present]
+
+    kind = pd.api.types.infer_dtype(sample_values(values), skipna=True)
+    if kind in ("integer", "floating", "mixed-integer-float"):
+        parsed, how = _parse_numeric(pd.to_numeric(values, errors="coerce"))
+    else:
+        parsed, how = _parse_strings(values)
+    if values is s:
+        return parsed, how
+    out = np.full(len(s), np.datetime64("NaT"), dtype="datetime64[ns]")
+    out[present] = parsed.to_numpy()
+    return pd.Series(out, index=s.index), how
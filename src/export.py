@@ -0,0 +1,157 @@
+"""
+결과 내보내기
+--------------------------------
+필터 결과/카테고리 요약을 사용자가 고른 형식으로 저장한다. GUI에서는 백그라운드 작업으로 실행된다.
+
+- csv: utf-8-sig, EXPORT_CHUNK_ROWS 행씩 나눠 쓰고 마지막에 합계 행
+- parquet: pyarrow로 청크마다 row group 하나씩 (합계 행 없음, 데이터만)
+- xlsx: openpyxl write-only 모드로 행을 흘려 쓰므로 메모리 사용량이 행 수와 무관
+청크마다 진행 콜백을 호출하므로 도중에 취소할 수 있다. 같은 폴더의 임시 파일에 쓴 뒤 성공하면 대상 경로로 바꿔치우므로,
+취소/실패 시 원래 있던 파일은 그대로 남고 쓰다 만 임시 파일만 지운다.
+"""
+
+import os, math, time, logging, tempfile
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+from pipeline import COL_STORE, COL_AMOUNT, report_progress
+from tracing import tracer
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_ROWS = 100_000
+STAGE_EXPORT = "내보내기"
+
+EXPORT_FORMATS = {
+    "csv": ("CSV (*.csv)", ".csv"),
+    "parquet": ("Parquet (*.parquet)", ".parquet"),
+    "xlsx": ("Excel (*.xlsx)", ".xlsx"),
+}
+
+ExportResult = namedtuple("ExportResult", ["path", "fmt", "rows", "bytes", "seconds"])
+
+def available_formats() -> list:
+    """현재 환경에서 쓸 수 있는 형식 (pyarrow가 없으면 parquet 제외)"""
+    return [f for f in EXPORT_FORMATS if f != "parquet" or pq is not None]
+
+def format_for_path(path: str, default: str = "csv") -> str:
+    ext = os.path.splitext(path)[1].lower()
+    for fmt, (_, fmt_ext) in EXPORT_FORMATS.items():
+        if ext == fmt_ext:
+            return fmt
+    return default
+
+def export_stages(rows: int) -> list:
+    """청크별 진행 단계 이름 (진행률 표시용)"""
+    n = max(1, math.ceil(rows / EXPORT_CHUNK_ROWS))
+    return [f"{STAGE_EXPORT} {i}/{n}" for i in range(1, n + 1)]
+
+def _chunks(df: pd.DataFrame):
+    for start in range(0, max(len(df), 1), EXPORT_CHUNK_ROWS):
+        yield df.iloc[start:start + EXPORT_CHUNK_ROWS]
+
+def total_row(df: pd.DataFrame):
+    """가맹점/금액 컬럼이 있으면 합계 행, 없으면 None"""
+    if COL_STORE not in df.columns or COL_AMOUNT not in df.columns:
+        return None
+    row = {col: "" for col in df.columns}
+    row[COL_STORE] = "합계"
+    row[COL_AMOUNT] = df[COL_AMOUNT].sum()
+    return row
+
+# ===============================
+# 형식별 쓰기
+# ===============================
+def _write_csv(df, path, with_total, step):
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        for i, chunk in enumerate(_chunks(df)):
+            chunk.to_csv(f, index=False, header=(i == 0))
+            step()
+        total = total_row(df) if with_total else None
+        if total is not None:
+            pd.DataFrame([total], columns=df.columns).to_csv(f, index=False, header=False)
+
+def _write_parquet(df, path, with_total, step):
+    if pq is None:
+        raise RuntimeError("Parquet로 저장하려면 pyarrow가 필요합니다.")
+    from cache import arrow_safe
+
+    df = arrow_safe(df)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in _chunks(df):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            step()
+
+def _cell(value):
+    """openpyxl이 받는 파이썬 값으로 (NaT/NaN은 빈 칸)"""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _write_xlsx(df, path, with_total, step):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append([str(c) for c in df.columns])
+    for chunk in _chunks(df):
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append([_cell(v) for v in row])
+        step()
+    total = total_row(df) if with_total else None
+    if total is not None:
+        ws.append([_cell(v) if v != "" else None for v in total.values()])
+    wb.save(path)
+
+_WRITERS = {"csv": _write_csv, "parquet": _write_parquet, "xlsx": _write_xlsx}
+
+def export_frame(df: pd.DataFrame, path: str, fmt: str = None, with_total: bool = True,
+                 progress=None) -> ExportResult:
+    """df를 path에 fmt 형식으로 저장하고 (경로, 형식, 행 수, 바이트, 초) 반환"""
+    fmt = fmt or format_for_path(path)
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    stages = iter(export_stages(len(df)))
+
+    def step():
+        report_progress(progress, next(stages, STAGE_EXPORT))
+
+    start = time.perf_counter()
+    with tracer.stage(f"{STAGE_EXPORT}({fmt})", rows_in=len(df)) as st:
+        fd, tmp_path = tempfile.mkstemp(prefix=".export-", suffix=os.path.splitext(path)[1],
+                                        dir=os.path.dirname(os.path.abspath(path)))
+        os.close(fd)
+        try:
+            _WRITERS[fmt](df, tmp_path, with_total, step)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # 취소/실패 시 기존 파일은 건드리지 않고 쓰다 만 임시 파일만 지운다
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        st.rows_out = len(df)
+    result = ExportResult(path, fmt, len(df), os.path.getsize(path), time.perf_counter() - start)
+    logger.info("내보내기 완료: %s (%s, %d행, %d바이트, %.2fs)", *result)
+    return result
+
+def describe(result: ExportResult) -> str:
+    if result.bytes >= 2**20:
+        size = f"{result.bytes / 2**20:,.1f} MB"
+    else:
+        size = f"{result.bytes / 2**10:,.1f} KB"
+    return f"{result.path}\n{result.rows:,}행, {size} ({result.fmt}, {result.seconds:.2f}초)"
@@ -0,0 +1,108 @@
+"""
+누적 장부
+--------------------------------
+여러 명세서의 전처리 결과를 하나의 DataFrame에 이어 붙인다.
+
+- 거래 키: (DT, 가맹점, 금액, 같은 파일 안에서의 순번)의 해시
+  → 기간이 겹치는 연속 명세서의 중복 거래는 한 번만 들어간다
+- 새 파일을 추가할 때는 새 행만 해시/집계하고 기존 행은 다시 처리하지 않는다
+  (카테고리 합계와 기간 집계 큐브 모두 새 행만 더한다)
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+from pipeline import COL_STORE, COL_AMOUNT, COL_DT, COL_CATEGORY, ensure_categories, category_map_version
+from cube import SpendingCube
+
+logger = logging.getLogger(__name__)
+
+def transaction_keys(df: pd.DataFrame) -> np.ndarray:
+    """행별 거래 키 (uint64). 같은 날 같은 가맹점/금액 거래는 등장 순번으로 구분"""
+    cols = [c for c in (COL_DT, COL_STORE, COL_AMOUNT) if c in df.columns]
+    key_df = df[cols].copy()
+    key_df["_seq"] = key_df.groupby(cols, dropna=False, observed=True).cumcount()
+    return pd.util.hash_pandas_object(key_df, index=False).to_numpy()
+
+def concat_rows(frame: pd.DataFrame, added: pd.DataFrame) -> pd.DataFrame:
+    """장부 뒤에 새 행을 붙인다 (categorical 가맹점은 기존 코드를 유지한 채 새 가맹점만 범주에 추가)"""
+    if (isinstance(frame[COL_STORE].dtype, pd.CategoricalDtype)
+            and isinstance(added[COL_STORE].dtype, pd.CategoricalDtype)):
+        known = frame[COL_STORE].cat.categories
+        new = added[COL_STORE].cat.categories.difference(known, sort=False)
+        if len(new):
+            frame = frame.assign(**{COL_STORE: frame[COL_STORE].cat.add_categories(new)})
+        added = added.assign(**{COL_STORE: added[COL_STORE].cat.set_categories(frame[COL_STORE].cat.categories)})
+    return pd.concat([frame, added], ignore_index=True)
+
+class Ledger:
+    def __init__(self):
+        self.frame = None
+        self.sources = []           # [(경로, 추가된 행 수, 중복 제외 행 수)]
+        self._keys = set()
+        self._category_totals = None
+        self._category_version = None
+        self.cube = SpendingCube()
+
+    def __len__(self):
+        return 0 if self.frame is None else len(self.frame)
+
+    def clear(self):
+        self.__init__()
+
+    def append(self, df: pd.DataFrame, source: str) -> int:
+        """새 명세서를 추가하고 실제로 추가된(중복이 아닌) 행 수를 반환"""
+        df = ensure_categories(df)
+        keys = transaction_keys(df)
+        is_new = np.fromiter((k not in self._keys for k in keys), dtype=bool, count=len(keys))
+        added = df[is_new]
+        self._keys.update(keys[is_new].tolist())
+
+        if len(added):
+            # 기존 합계가 이전 CATEGORY_MAP/직접 지정 기준이면 먼저 전체를 다시 집계한 뒤 새 행을 더한다
+            self._refresh_category_totals()
+            if self.frame is None:
+                self.frame = added.reset_index(drop=True)
+            else:
+                self.frame = concat_rows(self.frame, added)
+            self.frame.attrs = dict(df.attrs)
+            delta = added.groupby(COL_CATEGORY, observed=True)[COL_AMOUNT].sum()
+            if self._category_totals is None:
+                self._category_totals = delta
+            else:
+                self._category_totals = self._category_totals.add(delta, fill_value=0)
+            self._category_version = category_map_version()
+            self.cube.update(added)
+        elif self.frame is None:
+            self.frame = added.reset_index(drop=True)
+
+        skipped = len(df) - len(added)
+        self.sources.append((source, len(added), skipped))
+        logger.info("장부 추가: %s (신규 %d행, 중복 %d행 제외, 누적 %d행)",
+                    source, len(added), skipped, len(self))
+        return len(added)
+
+    def _refresh_category_totals(self):
+        """CATEGORY_MAP이나 직접 지정이 바뀐 경우에만 전체를 다시 분류/집계"""
+        if self._category_totals is None or self._category_version == category_map_version():
+            return
+        self.frame = ensure_categories(self.frame)
+        self._category_totals = self.frame.groupby(COL_CATEGORY, observed=True)[COL_AMOUNT].sum()
+        self._category_version = category_map_version()
+
+    def spending_cube(self) -> SpendingCube:
+        """누적 기간 집계 (CATEGORY_MAP이 바뀐 경우에만 전체를 다시 묶는다)"""
+        if self.cube.is_stale() and self.frame is not None:
+            self.frame = ensure_categories(self.frame)
+            self.cube = SpendingCube.from_frame(self.frame)
+        return self.cube
+
+    def category_summary(self) -> pd.DataFrame:
+        """누적 카테고리별 합계 (추가 시점에 새 행만 집계해 둔 값)"""
+        if self.frame is None or self._category_totals is None:
+            return pd.DataFrame({COL_CATEGORY: [], COL_AMOUNT: []})
+        self._refresh_category_totals()
+        summary = self._category_totals.rename_axis(COL_CATEGORY).rename(COL_AMOUNT).reset_index()
+        summary[COL_CATEGORY] = summary[COL_CATEGORY].astype(str)
+        return summary
@@ -4,140 +4,134 @@
 PySide6 + pandas + matplotlib
 """
 
-import sys, os, json, logging
-from collections import OrderedDict
-import pandas as pd
+import sys, os, json, time, logging
+from functools import partial
 from PySide6.QtWidgets import (
     QMainWindow, QFileDialog, QMessageBox, QApplication,
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QCheckBox, QComboBox, QSizePolicy, QHeaderView
+    QHBoxLayout, QLabel, QPushButton,
+    QTableView, QCheckBox, QComboBox, QSizePolicy, QHeaderView,
+    QProgressBar, QToolButton, QPlainTextEdit, QInputDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer, QFileSystemWatcher
+from PySide6.QtGui import QFontDatabase
 from ui_main_window import Ui_MainWindow
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 
-# ===============================
-# config.json 불러오기
-# ===============================
-with open("config.json", "r", encoding="utf-8") as f:
-    CONFIG = json.load(f)
-
-APP_TITLE = CONFIG["APP_TITLE"]
-LOG_PATH = CONFIG["LOG_PATH"]
-RECENTS_PATH = CONFIG["RECENTS_PATH"]
+from config import get_config
+from tracing import tracer, trace_path_for
 
-COL_STORE = CONFIG["COL_STORE"]
-COL_AMOUNT = CONFIG["COL_AMOUNT"]
-COL_DT = CONFIG["COL_DT"]
+# pandas/matplotlib과 이를 쓰는 모듈(pipeline, cache, ...)은 창을 띄운 뒤
+# finish_startup() 또는 처음 쓰는 메서드 안에서 import 한다.
 
-DATE_COL_KEYS = CONFIG["DATE_COL_KEYS"]
-CATEGORY_MAP = CONFIG["CATEGORY_MAP"]
-
-# ===============================
-# 한글 폰트 설정
-# ===============================
-plt.rcParams['font.family'] = 'Malgun Gothic'  # Windows
-plt.rcParams['axes.unicode_minus'] = False     # 마이너스 깨짐 방지
-
-# ===============================
-# 로거 설정
-# ===============================
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    filename=LOG_PATH,
-    filemode="a",
-)
 logger = logging.getLogger(__name__)
 
-# ===============================
-# 유틸 함수 (데이터 처리)
-# ===============================
-def normalize_text_series(series: pd.Series) -> pd.Series:
-    """텍스트 정리: 특수공백 제거, 연속 공백 압축, 좌우 trim"""
-    series = series.astype(str)
-    return (series.str.replace("\u200b", "", regex=False)
-                  .str.replace("\xa0", " ", regex=False)
-                  .str.replace(r"\s+", " ", regex=True)
-                  .str.strip())
-
-def infer_category(name: str) -> str:
-    """가맹점 이름을 카테고리로 분류"""
-    for cat, keywords in CATEGORY_MAP.items():
-        for keyword in keywords:
-            if keyword.lower() in str(name).lower():
-                return cat
-    return "기타"
-
-def normalize_DT_column(df: pd.DataFrame) -> pd.DataFrame:
-    """여러 날짜 후보 컬럼을 검사하여 DT 컬럼 생성"""
-    candidates = [c for c in df.columns if any(k in c for k in DATE_COL_KEYS)]
-    dt = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
-
-    for col in candidates:
-        s = df[col]
-        if pd.api.types.is_numeric_dtype(s):
-            parsed = pd.to_datetime(s, unit="d", origin="1899-12-30", errors="coerce")
-        else:
-            ss = s.astype(str)
-            ss = (ss.str.replace("년", ".", regex=False)
-                    .str.replace("월", ".", regex=False)
-                    .str.replace("일", "", regex=False))
-            ss = ss.str.replace(r"[^0-9\.\-\/]", "", regex=True)
-            parsed = pd.to_datetime(ss, errors="coerce", format="%y.%m.%d")
-        dt = dt.fillna(parsed)
-
-    df[COL_DT] = dt
-    return df
-
-# ===============================
-# matplotlib 그래프 다이얼로그
-# ===============================
-class MplDialog(QWidget):
-    def __init__(self, title: str, plot_fn):
-        super().__init__()
-        self.setWindowTitle(title)
-        layout = QVBoxLayout(self)
-
-        figure = Figure(figsize=(6, 4))
-        canvas = FigureCanvas(figure)
-        layout.addWidget(canvas)
-        ax = figure.add_subplot(111)
-        plot_fn(ax)
-        canvas.draw()
+def setup_logging(config: dict):
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        filename=config["LOG_PATH"],
+        filemode="a",
+    )
+    # 단계별 계측 기록 (PROFILE_NEXT_RUN이면 첫 작업 하나를 cProfile로 측정)
+    tracer.configure(trace_path_for(config["LOG_PATH"]), profile=config.get("PROFILE_NEXT_RUN", False))
+
+# 차트 창 종류별 "데이터 없음" 안내 (None이면 조용히 무시)
+CHART_EMPTY_MESSAGES = {
+    "category": None,
+    "period": "차트로 표시할 유효한 날짜가 없습니다.",
+    "category_period": "차트로 표시할 유효한 날짜가 없습니다.",
+}
+
+# 카테고리 직접 지정 대화상자에서 지정을 해제하는 항목
+AUTO_CATEGORY = "(규칙에 따라 자동 분류)"
+
+# 기간 단위 (콤보 표시 이름, 차트 제목, 막대 라벨 형식)
+PERIOD_OPTIONS = {
+    "month": ("월별", "월별 지출", "%Y-%m"),
+    "week": ("주별", "주별 지출", "%Y-%m-%d"),
+    "day": ("일별", "일별 지출", "%Y-%m-%d"),
+}
+TOP_MERCHANTS = 20
 
 # ===============================
 # 메인 앱 클래스
 # ===============================
 class ExcelSumApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, config: dict = None):
         super().__init__()
+        self.config = config or get_config()
+        self.recents_path = self.config["RECENTS_PATH"]
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
-        self.chart_windows = []
+        self.charts = None      # ChartManager (차트를 처음 열 때 만든다)
 
         self.file_path = None
         self.df = None
         self.filtered = None
-
-        self.setWindowTitle(APP_TITLE)
+        self.cube = None        # 기간 집계 (차트를 처음 열 때 한 번 만든다)
+
+        # pandas가 필요한 객체는 첫 화면을 그린 뒤 finish_startup()에서 만든다
+        self.ready = False
+        self.first_paint_at = None
+        self.ledger = None
+        self.cache = None
+        self.masks = None
+        self.table_model = None
+
+        # 백그라운드 작업: 종류("load"/"analysis")별로 최신 작업 하나만 유지
+        self.pool = QThreadPool.globalInstance()
+        self._jobs = {}
+        self._request_seq = 0
+
+        # 입력 중 검색: 타이핑이 멈춘 뒤 한 번만 필터링, 키워드별 마스크는 캐시
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.config.get("SEARCH_DEBOUNCE_MS", 250))
+        self.search_timer.timeout.connect(self.run_live_search)
+
+        # 폴더 감시: 파일 이벤트가 몰려도 마지막 이벤트 후 한 번만 훑고, 읽기는 전용 풀에서 WATCH_WORKERS개까지
+        self.watch = None           # FolderState
+        self.fs_watcher = None
+        self._watch_inflight = {}   # 경로 → 읽는 중인 (크기, mtime)
+        self.watch_pool = QThreadPool(self)
+        self.watch_pool.setMaxThreadCount(max(1, int(self.config.get("WATCH_WORKERS", 2))))
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.setInterval(self.config.get("WATCH_DEBOUNCE_MS", 1000))
+        self.watch_timer.timeout.connect(self.scan_watch_folder)
+        # 파일이 연달아 반영돼도 표/차트는 마지막 반영 후 한 번만 다시 그린다
+        self.watch_refresh_timer = QTimer(self)
+        self.watch_refresh_timer.setSingleShot(True)
+        self.watch_refresh_timer.setInterval(self.config.get("SEARCH_DEBOUNCE_MS", 250))
+        self.watch_refresh_timer.timeout.connect(self.refresh_after_watch)
+
+        self.setWindowTitle(self.config["APP_TITLE"])
         logger.info("프로그램 실행 시작")
 
         # 버튼 이벤트 연결
         self.ui.btn_load_excel.clicked.connect(self.load_excel_dialog)
         self.ui.btn_calculate.setText("키워드 분석하기")
         self.ui.btn_calculate.clicked.connect(self.run_keyword_analysis)
+        self.ui.input_keyword.returnPressed.connect(self.run_keyword_analysis)
+        self.ui.input_keyword.textChanged.connect(self.schedule_live_search)
+        export_row = QHBoxLayout()
+        self.btn_export_result = QPushButton("검색 결과 내보내기")
+        self.btn_export_result.clicked.connect(self.export_result_action)
         self.btn_save_category = QPushButton("카테고리 요약 저장하기")
         self.btn_save_category.clicked.connect(self.save_category_summary_action)
-        self.ui.verticalLayout.addWidget(self.btn_save_category)
+        self.btn_set_category = QPushButton("선택 가맹점 카테고리 지정")
+        self.btn_set_category.clicked.connect(self.set_category_action)
+        export_row.addWidget(self.btn_export_result)
+        export_row.addWidget(self.btn_save_category)
+        export_row.addWidget(self.btn_set_category)
+        self.ui.verticalLayout.addLayout(export_row)
 
         # UI 요소 삽입
         self.setup_recent_files_ui()
         self.setup_quick_keywords_ui()
         self.setup_result_ui()
+        self.setup_progress_ui()
+        self.setup_profiler_ui()
 
         self.load_recent_files()
         self.setStyleSheet("""
@@ -159,6 +153,14 @@ class ExcelSumApp(QMainWindow):
         top_row.addWidget(QLabel("최근 파일:"))
         top_row.addWidget(self.cmb_recent)
         top_row.addWidget(self.btn_open_recent)
+        self.chk_ledger = QCheckBox("누적 모드")
+        self.chk_ledger.setToolTip("불러온 명세서를 하나의 장부로 합쳐 분석합니다 (중복 거래 제외)")
+        self.chk_ledger.toggled.connect(self.on_ledger_toggled)
+        top_row.addWidget(self.chk_ledger)
+        self.chk_watch = QCheckBox("폴더 감시")
+        self.chk_watch.setToolTip("폴더에 새로 들어오거나 바뀐 명세서를 자동으로 장부에 추가합니다")
+        self.chk_watch.toggled.connect(self.on_watch_toggled)
+        top_row.addWidget(self.chk_watch)
         self.ui.verticalLayout.insertLayout(1, top_row)
 
     def setup_quick_keywords_ui(self):
@@ -168,6 +170,8 @@ class ExcelSumApp(QMainWindow):
         kw_row.addWidget(QLabel("빠른 키워드:"))
         kw_row.addWidget(self.chk_norae)
         kw_row.addWidget(self.chk_cafe)
+        self.chk_norae.toggled.connect(self.schedule_live_search)
+        self.chk_cafe.toggled.connect(self.schedule_live_search)
         kw_row.addStretch()
         self.ui.verticalLayout.insertLayout(4, kw_row)
 
@@ -176,71 +180,208 @@ class ExcelSumApp(QMainWindow):
         self.lbl_summary.setAlignment(Qt.AlignCenter)
         self.ui.verticalLayout.insertWidget(7, self.lbl_summary)
 
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.ui.verticalLayout.insertWidget(8, self.table)
 
         charts_row = QHBoxLayout()
         self.btn_chart_category = QPushButton("카테고리 차트")
-        self.btn_chart_month = QPushButton("월별 지출 차트")
+        self.cmb_period = QComboBox()
+        for freq, (label, _, _) in PERIOD_OPTIONS.items():
+            self.cmb_period.addItem(label, freq)
+        self.cmb_period.currentIndexChanged.connect(self.refresh_open_charts)
+        self.btn_chart_month = QPushButton("기간별 지출 차트")
+        self.btn_chart_category_period = QPushButton("카테고리×기간 차트")
+        self.btn_top_merchants = QPushButton("상위 가맹점")
         self.btn_chart_category.clicked.connect(self.show_category_chart)
         self.btn_chart_month.clicked.connect(self.show_month_chart)
+        self.btn_chart_category_period.clicked.connect(self.show_category_period_chart)
+        self.btn_top_merchants.clicked.connect(self.show_top_merchants)
         charts_row.addWidget(self.btn_chart_category)
+        charts_row.addWidget(self.cmb_period)
         charts_row.addWidget(self.btn_chart_month)
+        charts_row.addWidget(self.btn_chart_category_period)
+        charts_row.addWidget(self.btn_top_merchants)
         self.ui.verticalLayout.insertLayout(9, charts_row)
 
+    def setup_progress_ui(self):
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(160)
+        self.btn_cancel = QPushButton("취소")
+        self.btn_cancel.clicked.connect(self.cancel_all_jobs)
+        self.ui.statusbar.addPermanentWidget(self.progress_bar)
+        self.ui.statusbar.addPermanentWidget(self.btn_cancel)
+        self.update_progress_visibility()
+
+    def setup_profiler_ui(self):
+        self.btn_profiler = QToolButton()
+        self.btn_profiler.setText("성능 기록 (마지막 실행)")
+        self.btn_profiler.setCheckable(True)
+        self.btn_profiler.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        self.btn_profiler.setArrowType(Qt.RightArrow)
+        self.btn_profiler.toggled.connect(self.toggle_profiler_panel)
+
+        self.txt_profiler = QPlainTextEdit()
+        self.txt_profiler.setReadOnly(True)
+        self.txt_profiler.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.txt_profiler.setVisible(False)
+
+        self.ui.verticalLayout.addWidget(self.btn_profiler)
+        self.ui.verticalLayout.addWidget(self.txt_profiler)
+
+    # --------------------------
+    # 지연 초기화 (첫 화면 이후)
+    # --------------------------
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_at is None:
+            self.first_paint_at = time.perf_counter()
+            # 이번 그리기가 끝난 뒤 이벤트 루프에서 무거운 모듈을 불러온다
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """pandas/pyarrow를 쓰는 모듈을 import 하고 데이터 관련 객체를 만든다
+
+        첫 화면 직후 호출되지만, 그 전에 파일을 열거나 체크박스를 누르는 경로에서도 먼저 불러 둔다 (두 번째 호출부터는 바로 반환)
+        """
+        if self.ready:
+            return
+        start = time.perf_counter()
+        from table_model import DataFrameTableModel
+        from cache import StatementCache
+        from ledger import Ledger
+        from matcher import MaskCache
+
+        self.table_model = DataFrameTableModel(self)
+        self.table.setModel(self.table_model)
+        self.ledger = Ledger()
+        self.cache = StatementCache.from_config(self.config)
+        self.masks = MaskCache()
+        self.ready = True
+        logger.info("데이터 모듈 로드 완료 (%.0f ms)", (time.perf_counter() - start) * 1000)
+        if self.config.get("WATCH_DIR"):
+            # 다른 핸들러 안에서 불렸을 수 있으므로 감시 시작은 이벤트 루프로 미룬다
+            QTimer.singleShot(0, lambda: self.chk_watch.setChecked(True))
+
+    def toggle_profiler_panel(self, checked: bool):
+        self.btn_profiler.setArrowType(Qt.DownArrow if checked else Qt.RightArrow)
+        self.txt_profiler.setVisible(checked)
+        self.refresh_profiler_panel()
+
+    def refresh_profiler_panel(self):
+        if self.btn_profiler.isChecked():
+            self.txt_profiler.setPlainText(tracer.format_run())
 
     # ======================
-    # 공통 유틸 메서드
+    # 백그라운드 작업 관리
     # ======================
-    def load_excel_from_path(self, path: str) -> pd.DataFrame:
-        """엑셀 파일을 읽어서 DataFrame 반환"""
-        try:
-            try:
-                df = pd.read_excel(path, engine="openpyxl", header=1)
-            except:
-                df = pd.read_excel(path, engine="openpyxl")
-            logger.info("엑셀 파일 로드 성공: %s", path)
-            return df
-        except Exception as e:
-            logger.exception("엑셀 파일 로드 실패: %s", path)
-            raise
+    def start_job(self, kind: str, stages: list, fn, args: tuple, on_done, error_fmt: str,
+                  pool=None, on_failed=None):
+        """같은 종류의 이전 작업을 취소하고 새 작업을 스레드 풀에서 시작
+
+        on_failed를 주면 오류 대화상자 대신 on_failed(메시지)를 호출한다.
+        """
+        from workers import PipelineWorker
+
+        self.cancel_job(kind)
+        self._request_seq += 1
+        run_name = kind.split(":")[0]
+        worker = PipelineWorker(self._request_seq, stages, tracer.wrap(run_name, fn), *args)
+        worker.signals.progress.connect(self.on_job_progress)
+        worker.signals.finished.connect(self.on_job_finished)
+        worker.signals.failed.connect(self.on_job_failed)
+        worker.signals.cancelled.connect(self.on_job_cancelled)
+        self._jobs[kind] = (worker, on_done, error_fmt, on_failed)
+
+        self.progress_bar.setRange(0, len(stages))
+        self.progress_bar.setValue(0)
+        self.ui.statusbar.showMessage(f"{stages[0]} 중...")
+        self.update_progress_visibility()
+        (pool or self.pool).start(worker)
+
+    def cancel_job(self, kind: str):
+        job = self._jobs.pop(kind, None)
+        if job:
+            job[0].cancel()
+        self.update_progress_visibility()
+
+    def cancel_all_jobs(self):
+        for kind in list(self._jobs):
+            self.cancel_job(kind)
+        self._watch_inflight.clear()    # 취소한 감시 파일은 다음 이벤트 때 다시 읽는다
+        self.ui.statusbar.showMessage("작업이 취소되었습니다.", 3000)
+
+    def _pop_current_job(self, request_id: int):
+        """request_id가 현재 작업이면 꺼내서 반환, 이미 대체된(오래된) 작업이면 None"""
+        for kind, job in self._jobs.items():
+            if job[0].request_id == request_id:
+                del self._jobs[kind]
+                self.update_progress_visibility()
+                return job
+        return None
+
+    def update_progress_visibility(self):
+        busy = bool(self._jobs)
+        self.progress_bar.setVisible(busy)
+        self.btn_cancel.setVisible(busy)
+
+    def on_job_progress(self, request_id: int, done: int, total: int, stage: str):
+        if not any(job[0].request_id == request_id for job in self._jobs.values()):
+            return
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.ui.statusbar.showMessage(f"{stage} 완료 ({done}/{total})")
+
+    def on_job_finished(self, request_id: int, result):
+        job = self._pop_current_job(request_id)
+        if job is None:
+            return
+        self.ui.statusbar.clearMessage()
+        job[1](result)
+        self.refresh_profiler_panel()
+
+    def on_job_failed(self, request_id: int, message: str):
+        job = self._pop_current_job(request_id)
+        if job is None:
+            return
+        self.ui.statusbar.clearMessage()
+        if job[3] is not None:
+            job[3](message)
+            return
+        QMessageBox.critical(self, "에러", job[2].format(message))
+
+    def on_job_cancelled(self, request_id: int):
+        self._pop_current_job(request_id)
+
+    def closeEvent(self, event):
+        self.stop_watch()
+        self.cancel_all_jobs()
+        if self.charts is not None:
+            self.charts.close_all()
+        if self.ready:
+            from pipeline import close_category_index
+
+            # 취소된 작업이 색인을 쓰는 중일 수 있으므로 잠시 기다린 뒤 닫는다
+            self.watch_pool.waitForDone(2000)
+            self.pool.waitForDone(2000)
+            close_category_index()
+        super().closeEvent(event)
 
-    def preprocess_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """가맹점/금액/날짜 전처리"""
-        df.columns = df.columns.str.strip()
-        if COL_STORE in df.columns:
-            df[COL_STORE] = normalize_text_series(df[COL_STORE])
-            df = df[~df[COL_STORE].isin(["이용하신 가맹점", "올라운드 선택1 할인"])]
-        if COL_AMOUNT in df.columns:
-            df[COL_AMOUNT] = pd.to_numeric(df[COL_AMOUNT], errors="coerce").fillna(0)
-            
-        df = normalize_DT_column(df)
-        
-        df["_is_tx"] = True
-        if COL_STORE in df.columns:
-            df["_is_tx"] &= df[COL_STORE].astype(str).str.strip().ne("") & df[COL_STORE].notna()
-        if COL_AMOUNT in df.columns:
-            amt = pd.to_numeric(df[COL_AMOUNT], errors="coerce").fillna(0)
-            df["_is_tx"] &= amt.abs() > 0
-            
-        return df
-
-    def show_chart(self, title: str, plot_fn):
-        """공통 차트 다이얼로그 표시"""
-        dlg = MplDialog(title, plot_fn)
-        self.chart_windows.append(dlg)
-        dlg.show()
-        dlg.raise_()
 
+    # ======================
+    # 공통 유틸 메서드
+    # ======================
     # ======================
     # 최근 파일 관리
     # ======================
     def load_recent_files(self):
         self.cmb_recent.clear()
         files = []
-        if os.path.exists(RECENTS_PATH):
+        if os.path.exists(self.recents_path):
             try:
-                with open(RECENTS_PATH, "r", encoding="utf-8") as f:
+                with open(self.recents_path, "r", encoding="utf-8") as f:
                     files = json.load(f)
             except:
                 files = []
@@ -252,28 +393,22 @@ class ExcelSumApp(QMainWindow):
 
     def save_recent_file(self, path: str):
         files = []
-        if os.path.exists(RECENTS_PATH):
+        if os.path.exists(self.recents_path):
             try:
-                with open(RECENTS_PATH, "r", encoding="utf-8") as f:
+                with open(self.recents_path, "r", encoding="utf-8") as f:
                     files = json.load(f)
             except:
                 files = []
         files = [path] + [p for p in files if p != path]
         files = files[:10]
-        with open(RECENTS_PATH, "w", encoding="utf-8") as f:
+        with open(self.recents_path, "w", encoding="utf-8") as f:
             json.dump(files, f, ensure_ascii=False, indent=2)
         self.load_recent_files()
 
     def open_recent_selected(self):
         text = self.cmb_recent.currentText()
         if text and text != "(기록 없음)" and os.path.exists(text):
-            try:
-                self.df = self.load_excel_from_path(text)
-                self.df = self.preprocess_dataframe(self.df)
-                self.file_path = text
-                QMessageBox.information(self, "파일 선택됨", f"선택된 파일:\n{self.file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "에러", f"최근 파일을 불러오는 중 오류 발생:\n{e}")
+            self.start_load(text, False, "최근 파일을 불러오는 중 오류 발생:\n{}")
         else:
             QMessageBox.warning(self, "알림", "열 수 있는 최근 파일이 없습니다.")
 
@@ -286,24 +421,182 @@ class ExcelSumApp(QMainWindow):
         )
         if not file_path:
             return
-        try:
-            self.df = self.load_excel_from_path(file_path)
-            self.df = self.preprocess_dataframe(self.df)
-            self.file_path = file_path
-            self.save_recent_file(file_path)
-            QMessageBox.information(self, "파일 선택됨", f"선택된 파일:\n{self.file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "에러", f"엑셀 파일을 불러오는 중 오류 발생:\n{e}")
+        self.start_load(file_path, True, "엑셀 파일을 불러오는 중 오류 발생:\n{}")
+
+    def start_load(self, path: str, remember: bool, error_fmt: str):
+        """백그라운드에서 파일 로드 + 전처리 (진행 중인 분석은 데이터가 바뀌므로 취소)"""
+        self.finish_startup()
+        self.cancel_job("analysis")
+        ledger_mode = self.chk_ledger.isChecked()
+
+        def on_done(df):
+            self.file_path = path
+            self.cube = None
+            if remember:
+                self.save_recent_file(path)
+            if ledger_mode and self.chk_ledger.isChecked():
+                added = self.ledger.append(df, path)
+                self.df = self.ledger.frame
+                skipped = self.ledger.sources[-1][2]
+                QMessageBox.information(
+                    self, "장부에 추가됨",
+                    f"추가된 파일:\n{path}\n\n신규 {added}건, 중복 {skipped}건 제외\n"
+                    f"누적 {len(self.ledger.sources)}개 파일, {len(self.ledger)}건")
+            else:
+                self.df = df
+                QMessageBox.information(self, "파일 선택됨", f"선택된 파일:\n{self.file_path}")
+            self.schedule_live_search()
+            self.refresh_open_charts()
+
+        from pipeline import LOAD_STAGES, COL_STORE
+
+        def load(path, progress=None):
+            df = self.cache.load_and_preprocess(path, progress)
+            if not ledger_mode:
+                # 첫 검색의 가맹점 factorize를 UI 스레드 대신 여기서 (누적 모드는 장부 프레임이 UI 스레드에서 만들어진다)
+                self.masks.bind(df, df[COL_STORE])
+            return df
+
+        # 누적 모드에서는 여러 파일을 연달아 불러와도 서로 취소하지 않는다
+        kind = f"load:{path}" if ledger_mode else "load"
+        self.start_job(kind, LOAD_STAGES, load, (path,), on_done, error_fmt)
+
+    def on_ledger_toggled(self, checked: bool):
+        """누적 모드 켜기: 현재 파일을 장부의 첫 항목으로 / 끄기: 장부 비우기"""
+        self.finish_startup()
+        if checked:
+            if self.df is not None and len(self.ledger) == 0:
+                self.ledger.append(self.df, self.file_path or "")
+                self.df = self.ledger.frame
+        else:
+            self.chk_watch.setChecked(False)    # 감시 결과는 장부에 쌓이므로 함께 끈다
+            self.ledger.clear()
+        self.refresh_open_charts()
 
     # ======================
-    # 키워드 분석
+    # 폴더 감시
     # ======================
-    def run_keyword_analysis(self):
-        if self.df is None:
-            QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오세요.")
+    def on_watch_toggled(self, checked: bool):
+        if not checked:
+            self.stop_watch()
+            return
+        folder = self.config.get("WATCH_DIR") or ""
+        if not os.path.isdir(folder):
+            folder = QFileDialog.getExistingDirectory(self, "감시할 폴더 선택", folder)
+        if not folder:
+            self.set_watch_checked(False)
+            return
+        self.start_watch(folder)
+
+    def set_watch_checked(self, checked: bool):
+        """감시 체크박스 표시만 바꾼다 (toggled 처리 없이)"""
+        self.chk_watch.blockSignals(True)
+        self.chk_watch.setChecked(checked)
+        self.chk_watch.blockSignals(False)
+
+    def start_watch(self, folder: str):
+        """folder를 감시하며 새/바뀐 명세서를 누적 장부에 추가 (지금 있는 파일부터 반영)"""
+        from watcher import FolderState
+
+        self.stop_watch()
+        self.finish_startup()
+        self.set_watch_checked(True)
+        self.chk_ledger.setChecked(True)
+        settle_sec = self.watch_timer.interval() / 1000
+        self.watch = FolderState(folder, settle_sec=settle_sec)
+        self.fs_watcher = QFileSystemWatcher([self.watch.folder], self)
+        self.fs_watcher.directoryChanged.connect(self.schedule_watch_scan)
+        self.fs_watcher.fileChanged.connect(self.schedule_watch_scan)
+        logger.info("폴더 감시 시작: %s", self.watch.folder)
+        self.ui.statusbar.showMessage(f"폴더 감시 중: {self.watch.folder}", 3000)
+        self.scan_watch_folder()
+
+    def stop_watch(self):
+        if self.watch is None:
             return
+        self.watch_timer.stop()
+        self.fs_watcher.deleteLater()
+        self.fs_watcher = None
+        for kind in [k for k in self._jobs if k.startswith("watch:")]:
+            self.cancel_job(kind)
+        self._watch_inflight.clear()
+        logger.info("폴더 감시 중지: %s", self.watch.folder)
+        self.watch = None
+
+    def schedule_watch_scan(self, *_):
+        """파일 이벤트마다 타이머를 다시 걸어 이벤트가 멈춘 뒤 한 번만 훑는다"""
+        if self.watch is not None:
+            self.watch_timer.start()
+
+    def scan_watch_folder(self):
+        """크기/mtime이 바뀐 파일만 감시 풀에 올린다 (내용 해시 비교와 읽기는 작업 스레드에서)"""
+        if self.watch is None:
+            return
+        from pipeline import LOAD_STAGES
+        from watcher import read_if_changed
+
+        state = self.watch
+        for path in state.forget_missing():
+            logger.info("감시 폴더에서 사라진 파일 (장부의 행은 유지): %s", path)
+        # 제자리 덮어쓰기는 폴더 이벤트가 없으므로 파일도 감시한다
+        watched = set(self.fs_watcher.files())
+        new_files = [p for p in state.list_files() if p not in watched]
+        if new_files:
+            self.fs_watcher.addPaths(new_files)
+
+        changed, settling = state.scan()
+        if settling:
+            self.watch_timer.start()    # 아직 쓰는 중인 파일은 잠시 뒤 다시 확인
+        for path, signature in changed:
+            if self._watch_inflight.get(path) == signature:
+                continue
+            self._watch_inflight[path] = signature
+            self.start_job(f"watch:{path}", LOAD_STAGES, partial(read_if_changed, state, self.cache),
+                           (path, signature), partial(self.on_watch_file_done, state),
+                           "{}", pool=self.watch_pool,
+                           on_failed=partial(self.on_watch_file_failed, state, path, signature))
+
+    def on_watch_file_done(self, state, result):
+        path, signature, content_hash, df = result
+        if state is not self.watch:
+            return      # 감시를 멈추거나 다른 폴더로 바꾼 뒤 끝난 작업
+        if self._watch_inflight.get(path) == signature:
+            del self._watch_inflight[path]
+        state.record(path, signature, content_hash)
+        if df is None:
+            logger.info("폴더 감시: 내용이 같아 건너뜀 %s", path)
+            return
+        added = self.ledger.append(df, path)
+        self.df = self.ledger.frame
+        self.file_path = path
+        skipped = self.ledger.sources[-1][2]
+        self.ui.statusbar.showMessage(
+            f"폴더 감시: {os.path.basename(path)} 신규 {added}건, 중복 {skipped}건 제외 (누적 {len(self.ledger)}건)", 5000)
+        if added:
+            self.watch_refresh_timer.start()
+
+    def on_watch_file_failed(self, state, path: str, signature: tuple, message: str):
+        if state is not self.watch:
+            return
+        if self._watch_inflight.get(path) == signature:
+            del self._watch_inflight[path]
+        state.record_failure(path, signature)
+        logger.warning("폴더 감시: 읽기 실패 %s (%s)", path, message)
+        self.ui.statusbar.showMessage(f"폴더 감시: {os.path.basename(path)} 읽기 실패 ({message})", 5000)
+
+    def refresh_after_watch(self):
+        """장부에 새 행이 들어온 뒤 요약 라벨/결과 표/열린 차트를 갱신 (합계와 기간 집계는 장부가 새 행만 더해 둔 값)
 
-        df = self.df.copy()
+        보고 있던 화면을 유지한다: 키워드가 있으면 같은 키워드로 다시 거르고, 없으면 장부 전체를 보여 준다.
+        """
+        self.search_timer.stop()
+        self.run_live_search()
+        self.refresh_open_charts()
+
+    # ======================
+    # 키워드 분석
+    # ======================
+    def current_keywords(self) -> list:
         manual_kw = self.ui.input_keyword.text().strip()
         keywords = []
         if self.chk_norae.isChecked():
@@ -312,39 +605,111 @@ class ExcelSumApp(QMainWindow):
             keywords.append("카페")
         if manual_kw:
             keywords.extend([k.strip() for k in manual_kw.split(",") if k.strip()])
+        return keywords
+
+    def show_filter_result(self, filtered, run=None):
+        """필터 결과를 표/라벨에 표시 (run을 주면 표 표시 단계를 그 run에 기록)"""
+        from pipeline import COL_AMOUNT
+
+        self.filtered = filtered
+        matched = len(self.filtered)
+        total = float(self.filtered[COL_AMOUNT].sum())
+
+        # 결과 표시
+        self.populate_table(self.filtered, "DT", run=run)
+        self.ui.lbl_sum_result.setText(f"합산 결과: {total:,.0f} 원")
+        self.lbl_summary.setText(f"매칭 {matched}건, 합계 {total:,.0f}원")
+        return matched, total
+
+    def schedule_live_search(self, *_):
+        """입력/체크가 바뀔 때마다 타이머를 다시 걸어 마지막 변경 후 한 번만 검색"""
+        self.search_timer.start()
+
+    def run_live_search(self):
+        """입력이 멈춘 뒤 호출: 캐시된 키워드 마스크로 필터링만 하고 CSV는 저장하지 않는다"""
+        if self.df is None:
+            return
+        # 진행 중인 키워드 분석은 이전 키워드 기준이므로, 끝나서 이 결과를 덮어쓰지 않도록 취소
+        self.cancel_job("analysis")
+        keywords = self.current_keywords()
+        if not keywords:
+            # 분석 경로(filter_by_keywords)와 같이 키워드가 없으면 전체 행
+            self.show_filter_result(self.df)
+            return
+        from pipeline import filter_by_keywords
 
         try:
-            if COL_STORE not in df.columns or COL_AMOUNT not in df.columns:
-                raise ValueError(f"'{COL_STORE}' 또는 '{COL_AMOUNT}' 컬럼이 없습니다.")
-
-            # 키워드 필터
-            if keywords:
-                mask = pd.Series(False, index=df.index)
-                for kw in keywords:
-                    mask |= df[COL_STORE].str.contains(kw, case=False, regex=False, na=False)
-                self.filtered = df[mask].copy()
-            else:
-                self.filtered = df.copy()
+            with tracer.run("search") as run:
+                filtered = filter_by_keywords(self.df, keywords, masks=self.masks)
+        except ValueError as e:
+            self.ui.statusbar.showMessage(str(e), 3000)
+            return
+        self.show_filter_result(filtered, run)
+        self.refresh_profiler_panel()
 
-            matched = len(self.filtered)
-            total = float(self.filtered[COL_AMOUNT].sum())
+    def run_keyword_analysis(self):
+        if self.df is None:
+            QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오세요.")
+            return
+        self.search_timer.stop()
+        keywords = self.current_keywords()
+
+        def on_done(result):
+            filtered, run = result
+            matched, total = self.show_filter_result(filtered, run)
             logger.info("키워드 분석 완료: 매칭 %d건, 합계 %.0f원", matched, total)
 
-            # 결과 표시
-            self.populate_table(self.filtered, "DT")
-            self.ui.lbl_sum_result.setText(f"합산 결과: {total:,.0f} 원")
-            self.lbl_summary.setText(f"매칭 {matched}건, 합계 {total:,.0f}원")
+        from pipeline import ANALYSIS_STAGES, filter_by_keywords
 
-            # CSV 저장
-            self.save_filtered_csv(self.filtered, keywords)
+        def analyze(df, keywords, progress=None):
+            # 표 표시 단계를 같은 run에 붙이도록 작업 스레드의 run을 함께 돌려준다
+            return filter_by_keywords(df, keywords, progress, masks=self.masks), tracer.current_run()
 
-        except Exception as e:
-            logger.exception("키워드 분석 중 오류")
-            QMessageBox.critical(self, "에러", str(e))
+        # 새 요청이 들어오면 이전 분석은 취소된다 (저장은 내보내기 버튼으로 따로)
+        self.start_job("analysis", ANALYSIS_STAGES, analyze, (self.df, keywords), on_done, "{}")
 
     # ======================
-    # 카테고리 요약 저장
+    # 내보내기
     # ======================
+    def ask_export_path(self, default_name: str):
+        """저장 위치/형식 선택 (취소하면 (None, None))"""
+        from export import EXPORT_FORMATS, available_formats
+
+        formats = available_formats()
+        filters = [EXPORT_FORMATS[f][0] for f in formats]
+        path, selected = QFileDialog.getSaveFileName(
+            self, "내보내기", default_name + EXPORT_FORMATS[formats[0]][1], ";;".join(filters)
+        )
+        if not path:
+            return None, None
+        fmt = formats[filters.index(selected)] if selected in filters else formats[0]
+        if not path.lower().endswith(EXPORT_FORMATS[fmt][1]):
+            path += EXPORT_FORMATS[fmt][1]
+        return path, fmt
+
+    def start_export(self, df, default_name: str, with_total: bool):
+        """선택한 형식으로 백그라운드 저장 (끝나면 행 수/파일 크기 안내)"""
+        from export import export_stages, export_frame, describe
+
+        path, fmt = self.ask_export_path(default_name)
+        if path is None:
+            return
+
+        def on_done(result):
+            QMessageBox.information(self, "완료", f"저장되었습니다.\n{describe(result)}")
+
+        self.start_job("export", export_stages(len(df)),
+                       partial(export_frame, fmt=fmt, with_total=with_total),
+                       (df, path), on_done, "내보내는 중 오류 발생:\n{}")
+
+    def export_result_action(self):
+        if self.filtered is None:
+            QMessageBox.warning(self, "경고", "먼저 키워드 분석을 실행하세요.")
+            return
+        now = time.strftime("%Y%m%d_%H%M")
+        kw_text = "_".join(self.current_keywords()) or "전체"
+        self.start_export(self.filtered, f"{kw_text}_내역_{now}", with_total=True)
+
     def save_category_summary_action(self):
         if self.df is None:
             QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오세요.")
@@ -352,19 +717,61 @@ class ExcelSumApp(QMainWindow):
 
         try:
             summary = self.generate_category_summary()
-            if summary.empty:
-                QMessageBox.warning(self, "알림", "카테고리 요약 결과가 없습니다.")
-                return
-            self.save_category_summary_csv(summary)
-            QMessageBox.information(self, "완료", "카테고리 요약 CSV가 저장되었습니다.")
         except Exception as e:
-            logger.exception("카테고리 요약 저장 중 오류")
+            logger.exception("카테고리 요약 생성 중 오류")
             QMessageBox.critical(self, "에러", str(e))
+            return
+        if summary.empty:
+            QMessageBox.warning(self, "알림", "카테고리 요약 결과가 없습니다.")
+            return
+        now = time.strftime("%Y%m%d_%H%M")
+        self.start_export(summary, f"카테고리_요약_{now}", with_total=False)
+
+    def set_category_action(self):
+        """결과 표에서 선택한 가맹점의 카테고리를 직접 지정 (색인에 저장되어 다음 실행에도 유지)"""
+        index = self.table.currentIndex()
+        if self.table_model is None or not index.isValid():
+            QMessageBox.warning(self, "경고", "결과 표에서 가맹점을 먼저 선택하세요.")
+            return
+        from pipeline import COL_STORE, CATEGORY_MAP, get_category_index
+
+        store_index = get_category_index()
+        if store_index is None:
+            QMessageBox.warning(self, "경고", "카테고리 색인이 꺼져 있습니다 (config.json의 CATEGORY_INDEX_PATH).")
+            return
+        merchant = self.table_model.row_value(index.row(), COL_STORE)
+        if merchant is None:
+            return
+        merchant = str(merchant)
+        current, overridden = store_index.category_of(merchant)
+        choices = list(dict.fromkeys(list(CATEGORY_MAP) + ["기타"])) + [AUTO_CATEGORY]
+        state = "직접 지정" if overridden else "자동 분류"
+        choice, ok = QInputDialog.getItem(self, "카테고리 지정", f"{merchant}\n현재: {current} ({state})",
+                                          choices, choices.index(current), False)
+        if not ok:
+            return
+        if choice == AUTO_CATEGORY:
+            store_index.clear_override(merchant)
+        else:
+            store_index.set_override(merchant, choice)
+        self.apply_category_change()
+
+    def apply_category_change(self):
+        """직접 지정이 바뀐 뒤: 카테고리 컬럼(색인 조회)과 검색 결과, 열린 차트를 갱신"""
+        from pipeline import ensure_categories
+
+        if self.df is None:
+            return
+        self.df = ensure_categories(self.df)
+        self.run_live_search()
+        self.refresh_open_charts()
 
     # ======================
     # 보조 함수들
     # ======================
-    def populate_table(self, df, date_col="DT"):
+    def populate_table(self, df, date_col="DT", run=None):
+        from pipeline import COL_STORE, COL_AMOUNT, DISPLAY_COLUMNS
+
         show_cols = []
         if date_col and date_col in df.columns:
             show_cols.append(date_col)
@@ -372,101 +779,134 @@ class ExcelSumApp(QMainWindow):
             show_cols.append(COL_STORE)
         if COL_AMOUNT in df.columns:
             show_cols.append(COL_AMOUNT)
-            
-        view = df[show_cols].copy()
-        
-        if date_col and date_col in view.columns:
-            view[date_col] = pd.to_datetime(view[date_col], errors="coerce").dt.strftime("%y-%m-%d")
-        
-        if COL_AMOUNT in view.columns:
-            view[COL_AMOUNT] = view[COL_AMOUNT].map(lambda x: f"{x:,.0f}")
-
-        self.table.clear()
-        self.table.setColumnCount(len(view.columns))
-        self.table.setRowCount(len(view))
-        self.table.setHorizontalHeaderLabels([str(c) for c in view.columns])
-
-        for r, (_, row) in enumerate(view.iterrows()):
-            for c, col_name in enumerate(view.columns):
-                item = QTableWidgetItem(str(row[col_name]))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(r, c, item)
-                
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Interactive)
-
-    def save_filtered_csv(self, df, keywords):
-        out_df = df.copy()
-        total = out_df[COL_AMOUNT].sum()
-        total_row = {col: "" for col in out_df.columns}
-        total_row[COL_STORE] = "합계"
-        total_row[COL_AMOUNT] = total
-        out_df = pd.concat([out_df, pd.DataFrame([total_row])], ignore_index=True)
-
-        now = pd.Timestamp.now().strftime("%Y%m%d_%H%M")
-        kw_text = "_".join(keywords) if keywords else "전체"
-        filename = f"{kw_text}_내역_{now}.csv"
-        out_df.to_csv(filename, encoding="utf-8-sig", index=False)
+        show_cols.extend(c for c in DISPLAY_COLUMNS if c in df.columns and c not in show_cols)
+
+        # 셀 문자열은 모델이 보이는 행에 대해서만 만든다
+        with tracer.stage("테이블 표시", rows_in=len(df), run=run):
+            self.table_model.set_frame(df, show_cols, date_cols=(date_col,), amount_cols=(COL_AMOUNT,))
+            self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
 
     def generate_category_summary(self):
-        df = self.preprocess_dataframe(self.df.copy())
-        df["카테고리"] = df[COL_STORE].apply(infer_category)
-        return df.groupby("카테고리", as_index=False)[COL_AMOUNT].sum()
+        from pipeline import generate_category_summary, ensure_categories
 
-    def save_category_summary_csv(self, summary):
-        now = pd.Timestamp.now().strftime("%Y%m%d_%H%M")
-        filename = f"카테고리_요약_{now}.csv"
-        summary.to_csv(filename, encoding="utf-8-sig", index=False)
+        if self.chk_ledger.isChecked() and len(self.ledger):
+            # 장부는 파일을 추가할 때마다 새 행만 집계해 둔다
+            return self.ledger.category_summary()
+        # 카테고리는 로드 시 한 번 계산되며 CATEGORY_MAP이 바뀐 경우에만 갱신된다
+        self.df = ensure_categories(self.df)
+        return generate_category_summary(self.df)
 
     # --------------------------
     # 차트 표시
     # --------------------------
+    def chart_manager(self):
+        if self.charts is None:
+            from charts import ChartManager
+            self.charts = ChartManager()
+        return self.charts
+
     def show_category_chart(self):
         if self.df is None or self.filtered is None:
             QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오고 키워드 분석을 실행하세요.")
             return
-        summary = self.generate_category_summary()
-        if summary.empty:
-            return
-        self.show_chart("카테고리 차트", lambda ax: (
-            ax.bar(summary["카테고리"], summary[COL_AMOUNT]),
-            ax.set_title("카테고리별 지출"),
-            ax.tick_params(axis="x", rotation=20)
-        ))
+        self.open_chart("category")
+
+    def current_cube(self):
+        """현재 데이터의 기간 집계 (누적 모드는 장부가 새 행만 더해 둔 큐브)"""
+        from pipeline import ensure_categories
+        from cube import SpendingCube
+
+        if self.chk_ledger.isChecked() and len(self.ledger):
+            return self.ledger.spending_cube()
+        if self.cube is None or self.cube.is_stale():
+            self.df = ensure_categories(self.df)
+            self.cube = SpendingCube.from_frame(self.df)
+        return self.cube
 
     def show_month_chart(self):
         if self.df is None or self.filtered is None:
             QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오고 키워드 분석을 실행하세요.")
             return
-        base = self.df.copy()
-        if "DT" not in base.columns:
-            base = self.preprocess_dataframe(base)
+        self.open_chart("period")
 
-        # 실제 거래만 사용
-        base = base[base.get("_is_tx", True)].copy()
+    def show_category_period_chart(self):
+        if self.df is None or self.filtered is None:
+            QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오고 키워드 분석을 실행하세요.")
+            return
+        self.open_chart("category_period")
+
+    def chart_data(self, kind: str):
+        """(창 제목, 차트 제목, 막대 라벨, [(스택 이름, 값)], 라벨 회전) (데이터가 없으면 None)"""
+        from pipeline import COL_CATEGORY, COL_AMOUNT
+        from cube import COL_PERIOD
+
+        if kind == "category":
+            summary = self.generate_category_summary()
+            if summary.empty:
+                return None
+            return ("카테고리 차트", "카테고리별 지출", summary[COL_CATEGORY],
+                    [(COL_AMOUNT, summary[COL_AMOUNT])], 20)
+
+        freq = self.cmb_period.currentData()
+        label, title, fmt = PERIOD_OPTIONS[freq]
+        if kind == "period":
+            summary = self.current_cube().by_period(freq)
+            if summary.empty:
+                return None
+            return (f"{title} 차트", title, summary[COL_PERIOD].dt.strftime(fmt),
+                    [(COL_AMOUNT, summary[COL_AMOUNT])], 45)
+        if kind == "category_period":
+            table = self.current_cube().category_by_period(freq)
+            if table.empty:
+                return None
+            return (f"카테고리×{label} 차트", f"카테고리별 {label} 지출", table.index.strftime(fmt),
+                    [(cat, table[cat]) for cat in table.columns], 45)
+        raise ValueError(f"알 수 없는 차트 종류: {kind}")
+
+    def open_chart(self, kind: str, activate: bool = True):
+        """kind 차트 창을 열거나, 이미 열려 있으면 그 창의 막대를 갱신"""
+        data = self.chart_data(kind)
+        if data is None:
+            if activate and CHART_EMPTY_MESSAGES[kind]:
+                QMessageBox.information(self, "알림", CHART_EMPTY_MESSAGES[kind])
+            return
+        window_title, title, labels, stacks, rotation = data
+        self.chart_manager().bar_chart(kind, window_title, title, labels, stacks, rotation, activate)
 
-        # 차트를 그리려면 날짜가 필요하므로, DT가 있는 행만 집계(원본 삭제 아님)
-        chart_df = base.dropna(subset=["DT"]).copy()
-        if chart_df.empty:
-            QMessageBox.information(self, "알림", "차트로 표시할 유효한 날짜가 없습니다.")
+    def show_top_merchants(self, activate: bool = True):
+        if self.df is None:
+            QMessageBox.warning(self, "경고", "먼저 엑셀 파일을 불러오세요.")
             return
+        top = self.current_cube().top_merchants(TOP_MERCHANTS)
+        if top.empty:
+            if activate:
+                QMessageBox.information(self, "알림", "집계할 거래가 없습니다.")
+            return
+        from pipeline import COL_AMOUNT
 
-        chart_df["YYYY-MM"] = chart_df["DT"].dt.strftime("%Y-%m")
-        month_summary = (chart_df.groupby("YYYY-MM", as_index=False)[COL_AMOUNT]
-                                .sum()
-                                .sort_values("YYYY-MM"))
+        self.chart_manager().table("top_merchants", f"상위 가맹점 {len(top)}곳", top,
+                                   amount_cols=(COL_AMOUNT,), activate=activate)
 
-        self.show_chart("월별 지출 차트", lambda ax: (
-            ax.bar(month_summary["YYYY-MM"], month_summary[COL_AMOUNT]),
-            ax.set_title("월별 지출"),
-            ax.tick_params(axis="x", rotation=45)
-        ))
+    def refresh_open_charts(self, *_):
+        """데이터나 기간 단위가 바뀌면 열려 있는 차트 창만 다시 계산해 그 자리에서 갱신"""
+        if self.charts is None or self.df is None:
+            return
+        for kind in self.charts.open_kinds():
+            if kind == "top_merchants":
+                self.show_top_merchants(activate=False)
+            else:
+                self.open_chart(kind, activate=False)
 
 # ===============================
 # 실행부
 # ===============================
-if __name__ == "__main__":
+def main():
+    config = get_config()
+    setup_logging(config)
     app = QApplication(sys.argv)
-    window = ExcelSumApp()
+    window = ExcelSumApp(config)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
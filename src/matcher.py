@@ -0,0 +1,180 @@
+"""
+다중 키워드 매처
+--------------------------------
+키워드 목록을 하나의 정규식으로 컴파일해 문자열을 한 번만 훑으며
+포함된 키워드를 모두 찾는다. 키워드 필터와 카테고리 분류가 같은 엔진을 쓴다.
+
+- 비교는 원래 구현과 같이 소문자 기준 부분 문자열 포함 여부
+- Series는 고유값 단위로 검사한 뒤 코드로 펼친다 (명세서는 같은 가맹점이 반복됨)
+- MaskCache는 입력 중 검색용으로 키워드별 마스크를 기억해 두고 바뀐 키워드만 계산한다
+"""
+
+import re, json, threading
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+class KeywordMatcher:
+    def __init__(self, keywords, labels=None):
+        self.keywords = list(keywords)
+        self.labels = list(labels) if labels is not None else list(self.keywords)
+        lowered = [k.lower() for k in self.keywords]
+
+        # 한 위치에서는 가장 긴 키워드가 잡히도록 길이 내림차순으로 나열한다.
+        # 같은 위치에서 함께 일치하는 더 짧은 키워드는 모두 그 키워드의 접두사이므로
+        # _covers로 한꺼번에 복원할 수 있다 (lookahead라 겹치는 위치도 모두 검사).
+        alts = sorted(set(lowered), key=len, reverse=True)
+        if alts:
+            self._pattern = re.compile("(?=(" + "|".join(re.escape(a) for a in alts) + "))")
+        else:
+            self._pattern = None
+        self._covers = {
+            a: tuple(i for i, k in enumerate(lowered) if a.startswith(k))
+            for a in alts
+        }
+
+    # --------------------------
+    # 단일 문자열
+    # --------------------------
+    def find_indices(self, text) -> tuple:
+        """text에 포함된 키워드의 인덱스 (오름차순)"""
+        if self._pattern is None or not isinstance(text, str):
+            return ()
+        hits = set()
+        for found in self._pattern.findall(text.lower()):
+            hits.update(self._covers[found])
+        return tuple(sorted(hits))
+
+    def first_label(self, text, default=None):
+        """목록 순서상 가장 앞에 있는 일치 키워드의 라벨"""
+        hits = self.find_indices(text)
+        return self.labels[hits[0]] if hits else default
+
+    # --------------------------
+    # Series (고유값 단위)
+    # --------------------------
+    def _scan_unique(self, series: pd.Series):
+        codes, uniques = pd.factorize(series)
+        return codes, [self.find_indices(u) for u in uniques]
+
+    def mask(self, series: pd.Series) -> pd.Series:
+        """키워드 중 하나라도 포함된 행 True"""
+        codes, hits = self._scan_unique(series)
+        # 코드 -1(결측)은 마지막에 덧붙인 False를 가리킨다
+        table = np.array([bool(h) for h in hits] + [False], dtype=bool)
+        return pd.Series(table[codes], index=series.index)
+
+    def keyword_masks(self, series: pd.Series) -> dict:
+        """키워드별 포함 여부 마스크 (한 번의 스캔으로 계산)"""
+        codes, hits = self._scan_unique(series)
+        tables = np.zeros((len(self.keywords), len(hits) + 1), dtype=bool)
+        for u, h in enumerate(hits):
+            tables[list(h), u] = True
+        return {kw: pd.Series(tables[i][codes], index=series.index)
+                for i, kw in enumerate(self.keywords)}
+
+    def label_series(self, series: pd.Series, default=None) -> pd.Series:
+        """행마다 first_label 결과"""
+        codes, hits = self._scan_unique(series)
+        table = np.array([self.labels[h[0]] if h else default for h in hits] + [default], dtype=object)
+        return pd.Series(table[codes], index=series.index)
+
+# ===============================
+# 키워드별 마스크 캐시 (입력 중 검색)
+# ===============================
+MASK_CACHE_SIZE = 64
+
+class MaskCache:
+    """한 프레임의 가맹점 컬럼에 대한 키워드별 마스크 LRU 캐시
+
+    - 마스크는 고유값 단위 bool 배열로 보관하고 조회 때 코드로 행에 펼친다
+    - 키워드 하나를 더하거나 빼면 그 키워드만 계산하고 나머지는 캐시된 마스크를 OR 한다
+    - "스타" 다음 "스타벅스"처럼 캐시된 키워드를 포함하는 키워드는
+      그 키워드에 일치했던 고유값만 다시 검사한다
+    - 다른 프레임으로 조회하면 캐시를 비우고 새로 factorize 한다
+    """
+
+    def __init__(self, maxsize: int = MASK_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self._owner = None
+        self._codes = None
+        self._lowered = []
+        self._masks = OrderedDict()     # 소문자 키워드 → 고유값 단위 마스크 (마지막 칸은 결측)
+        self.hits = self.misses = self.narrowed = 0
+
+    def __len__(self):
+        return len(self._masks)
+
+    def _bind(self, owner, series: pd.Series):
+        if owner is self._owner:
+            return
+        self.clear()
+        codes, uniques = pd.factorize(series)
+        self._owner = owner
+        self._codes = codes
+        self._lowered = [u.lower() if isinstance(u, str) else "" for u in uniques]
+
+    def bind(self, owner, series: pd.Series):
+        """owner 프레임의 가맹점 컬럼을 미리 factorize (작업 스레드에서 불러 첫 검색을 가볍게)"""
+        with self._lock:
+            self._bind(owner, series)
+
+    def _unique_mask(self, kw: str) -> np.ndarray:
+        table = self._masks.get(kw)
+        if table is not None:
+            self._masks.move_to_end(kw)
+            self.hits += 1
+            return table
+
+        # kw를 포함하는 행은 kw의 부분 문자열(캐시된 키워드)도 포함한다 → 그 결과 안에서만 검사
+        parent = max((k for k in self._masks if k in kw), key=len, default=None)
+        if parent is not None:
+            candidates = np.flatnonzero(self._masks[parent][:-1])
+            self.narrowed += 1
+        else:
+            candidates = range(len(self._lowered))
+            self.misses += 1
+        table = np.zeros(len(self._lowered) + 1, dtype=bool)
+        for i in candidates:
+            if kw in self._lowered[i]:
+                table[i] = True
+
+        self._masks[kw] = table
+        while len(self._masks) > self.maxsize:
+            self._masks.popitem(last=False)
+        return table
+
+    def mask(self, owner, series: pd.Series, keywords) -> pd.Series:
+        """키워드 중 하나라도 포함된 행 True (owner가 바뀌면 series로 다시 바인딩)"""
+        with self._lock:
+            self._bind(owner, series)
+            combined = np.zeros(len(self._lowered) + 1, dtype=bool)
+            for kw in dict.fromkeys(k.lower() for k in keywords):
+                combined |= self._unique_mask(kw)
+            return pd.Series(combined[self._codes], index=series.index)
+
+# ===============================
+# 캐시된 매처 생성
+# ===============================
+@lru_cache(maxsize=64)
+def keyword_matcher(keywords: tuple) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+@lru_cache(maxsize=4)
+def _category_matcher(category_map_json: str) -> KeywordMatcher:
+    category_map = json.loads(category_map_json)
+    keywords, labels = [], []
+    for cat, kws in category_map.items():
+        for kw in kws:
+            keywords.append(kw)
+            labels.append(cat)
+    return KeywordMatcher(keywords, labels)
+
+def category_matcher(category_map: dict) -> KeywordMatcher:
+    """CATEGORY_MAP 내용이 같으면 같은 매처를 재사용 (설정이 바뀌면 새로 만든다)"""
+    return _category_matcher(json.dumps(category_map, ensure_ascii=False))
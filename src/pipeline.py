@@ -0,0 +1,327 @@
+"""
+명세서 처리 파이프라인
+--------------------------------
+GUI(main.py)와 배치 CLI(batch.py)가 함께 쓰는 데이터 처리 함수 모음
+Qt를 import하지 않는다.
+"""
+
+import time, logging, sqlite3, threading
+import numpy as np
+import pandas as pd
+
+from matcher import keyword_matcher, category_matcher
+from category_store import CategoryIndex, rules_version
+from reader import read_statement, preview_rows
+from profiles import identify, get_profile
+from dates import parse_date_column
+from tracing import tracer
+from config import get_config
+
+# ===============================
+# 설정 (config.json 위치는 config.find_config 참고)
+# ===============================
+CONFIG = get_config()
+
+COL_STORE = CONFIG["COL_STORE"]
+COL_AMOUNT = CONFIG["COL_AMOUNT"]
+COL_DT = CONFIG["COL_DT"]
+COL_CATEGORY = CONFIG.get("COL_CATEGORY", "카테고리")
+
+DATE_COL_KEYS = CONFIG["DATE_COL_KEYS"]
+CATEGORY_MAP = CONFIG["CATEGORY_MAP"]
+
+# 압축 프레임: 분석에 필요한 컬럼 + DISPLAY_COLUMNS만 남기고 dtype을 줄인다 (compact_frame 참고)
+COMPACT_FRAME = bool(CONFIG.get("COMPACT_FRAME", False))
+DISPLAY_COLUMNS = list(CONFIG.get("DISPLAY_COLUMNS", []))
+
+# 가맹점 → 카테고리 색인 파일 (빈 문자열이면 색인 없이 매번 키워드로 분류)
+CATEGORY_INDEX_PATH = CONFIG.get("CATEGORY_INDEX_PATH", "category_index.sqlite")
+
+# 전처리 결과가 달라지는 변경 시 올린다 (캐시 무효화용)
+PIPELINE_VERSION = 4
+
+logger = logging.getLogger(__name__)
+
+# 진행률 보고용 단계 이름
+STAGE_PROFILE = "형식 판별"
+STAGE_READ = "읽기"
+STAGE_NORMALIZE = "정규화"
+STAGE_DATES = "날짜 추론"
+STAGE_FILTER = "필터링"
+STAGE_CATEGORY = "카테고리"
+STAGE_COMPACT = "압축"
+
+LOAD_STAGES = [STAGE_READ, STAGE_NORMALIZE, STAGE_DATES]
+ANALYSIS_STAGES = [STAGE_FILTER]
+
+class PipelineCancelled(Exception):
+    """진행 콜백이 작업 중단을 요청할 때 발생"""
+
+def report_progress(progress, stage: str):
+    """단계 완료를 알린다 (콜백이 PipelineCancelled를 던지면 그대로 전파)"""
+    if progress is not None:
+        progress(stage)
+
+# ===============================
+# 유틸 함수 (데이터 처리)
+# ===============================
+def normalize_text_series(series: pd.Series) -> pd.Series:
+    """텍스트 정리: 특수공백 제거, 연속 공백 압축, 좌우 trim"""
+    series = series.astype(str)
+    return (series.str.replace("\u200b", "", regex=False)
+                  .str.replace("\xa0", " ", regex=False)
+                  .str.replace(r"\s+", " ", regex=True)
+                  .str.strip())
+
+_index_lock = threading.Lock()
+_category_index = None
+
+def get_category_index():
+    """설정의 가맹점 → 카테고리 색인 (처음 호출할 때 열고, 꺼져 있거나 열 수 없으면 None)"""
+    global _category_index
+    if not CATEGORY_INDEX_PATH:
+        return None
+    with _index_lock:
+        if _category_index is None:
+            try:
+                _category_index = CategoryIndex(CATEGORY_INDEX_PATH, CATEGORY_MAP)
+            except sqlite3.Error:
+                logger.exception("카테고리 색인을 열 수 없어 색인 없이 분류합니다: %s", CATEGORY_INDEX_PATH)
+                _category_index = False
+        return _category_index if _category_index is not False else None
+
+def close_category_index():
+    """열려 있는 카테고리 색인을 닫는다 (종료 시; 다음 get_category_index()는 다시 연다)"""
+    global _category_index
+    with _index_lock:
+        if _category_index:
+            _category_index.close()
+        _category_index = None
+
+def infer_category(name: str) -> str:
+    """가맹점 이름을 카테고리로 분류"""
+    index = get_category_index()
+    if index is not None:
+        return index.resolve([str(name)])[0]
+    return category_matcher(CATEGORY_MAP).first_label(str(name), "기타")
+
+def infer_category_series(series: pd.Series) -> pd.Series:
+    """가맹점 Series를 카테고리(categorical) Series로 분류 (고유 가맹점마다 한 번만 검사)
+
+    색인이 있으면 이미 아는 가맹점은 색인에서 찾고 처음 보는 가맹점만 키워드로 분류한다.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype) and pd.api.types.infer_dtype(series, skipna=False) != "string":
+        series = series.astype(str)
+    categories = list(dict.fromkeys(list(CATEGORY_MAP) + ["기타"]))
+    index = get_category_index()
+    if index is None:
+        labels = category_matcher(CATEGORY_MAP).label_series(series, "기타")
+        return labels.astype(pd.CategoricalDtype(categories))
+    # 고유 가맹점의 카테고리 코드를 행 코드로 펼쳐 categorical을 바로 만든다 (행 수만큼의 문자열 배열을 거치지 않음)
+    codes, uniques = pd.factorize(series)
+    position = {name: i for i, name in enumerate(categories)}
+    table = np.array([position.get(c, -1) for c in index.resolve([str(u) for u in uniques])] + [position["기타"]],
+                     dtype=np.int8 if len(categories) < 128 else np.int32)
+    return pd.Series(pd.Categorical.from_codes(table[codes], categories=categories), index=series.index)
+
+def category_map_version() -> str:
+    """카테고리 결과의 지문: CATEGORY_MAP 내용 + 직접 지정 변경 횟수 (카테고리 컬럼 재계산 여부 판단용)"""
+    index = get_category_index()
+    return f"{rules_version(CATEGORY_MAP)}:{index.override_revision if index is not None else 0}"
+
+def assign_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """카테고리 컬럼을 계산해 붙이고 사용한 CATEGORY_MAP 지문을 attrs에 기록"""
+    if COL_STORE in df.columns:
+        df[COL_CATEGORY] = infer_category_series(df[COL_STORE])
+        df.attrs["category_version"] = category_map_version()
+    return df
+
+def ensure_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """카테고리 컬럼이 없거나 CATEGORY_MAP이 바뀐 경우에만 다시 계산"""
+    if COL_CATEGORY not in df.columns or df.attrs.get("category_version") != category_map_version():
+        df = assign_categories(df)
+    return df
+
+def normalize_DT_column(df: pd.DataFrame, date_keys: list = None) -> pd.DataFrame:
+    """여러 날짜 후보 컬럼을 검사하여 DT 컬럼 생성 (모든 행이 채워지면 남은 후보는 건너뜀)"""
+    date_keys = DATE_COL_KEYS if date_keys is None else date_keys
+    candidates = [c for c in df.columns if any(k in c for k in date_keys)]
+    # 위치로 채운다: 첫 후보 컬럼은 복사 없이 통째로 넘기고, 이후 후보는 빈 행만 잘라 넘긴다
+    dt = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    for col in candidates:
+        missing = np.isnat(dt)
+        if not missing.any():
+            break
+        start = time.perf_counter()
+        column = df[col] if missing.all() else df[col].iloc[np.flatnonzero(missing)]
+        parsed, how = parse_date_column(column)
+        dt[missing] = parsed.to_numpy()
+        non_null = int(column.notna().sum())
+        ok = int(parsed.notna().sum())
+        logger.info("날짜 컬럼 '%s' [%s]: %d/%d행 파싱 (%.1f%%), %.3fs",
+                    col, how, ok, non_null, 100.0 * ok / non_null if non_null else 0.0,
+                    time.perf_counter() - start)
+
+    df[COL_DT] = dt
+    return df
+
+# ===============================
+# 파이프라인 단계
+# ===============================
+def load_excel_from_path(path: str, progress=None) -> pd.DataFrame:
+    """엑셀 파일을 읽어서 DataFrame 반환 (가맹점/금액/날짜 후보 컬럼만)
+
+    앞쪽 행으로 형식 프로필을 고르고, 프로필의 가맹점/금액 컬럼은 COL_STORE/COL_AMOUNT로 이름을 바꾼다.
+    사용한 프로필 이름은 df.attrs["profile"]에 남는다.
+    """
+    try:
+        with tracer.stage(STAGE_PROFILE):
+            profile, header_idx = identify(preview_rows(path))
+        with tracer.stage(STAGE_READ) as st:
+            df = read_statement(path, [profile.store, profile.amount], profile.date_keys, header_idx,
+                                extra=DISPLAY_COLUMNS)
+            df = df.rename(columns={profile.store: COL_STORE, profile.amount: COL_AMOUNT})
+            df.attrs["profile"] = profile.name
+            st.set_output(df)
+        logger.info("엑셀 파일 로드 성공: %s (%d행, 형식 '%s', 헤더 %s행)", path, len(df), profile.name,
+                    "자동" if header_idx is None else header_idx + 1)
+        report_progress(progress, STAGE_READ)
+        return df
+    except Exception as e:
+        logger.exception("엑셀 파일 로드 실패: %s", path)
+        raise
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """문자열 내용까지 포함한 DataFrame 메모리 (bytes)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """분석용 압축 프레임
+
+    - 가맹점/금액/DT(+ DISPLAY_COLUMNS)만 남기고 원본 날짜 후보 컬럼 등은 버린다
+    - 가맹점은 categorical, 금액은 모두 정수(원)이면 int64, DT는 datetime64
+    - 거래가 아닌 행(가맹점 없음, 0원)은 버리고 _is_tx 컬럼도 두지 않는다
+    """
+    before = frame_memory(df)
+    if "_is_tx" in df.columns:
+        df = df[df["_is_tx"].to_numpy()]
+    keep = [c for c in dict.fromkeys([COL_DT, COL_STORE, COL_AMOUNT, COL_CATEGORY] + DISPLAY_COLUMNS)
+            if c in df.columns]
+    df = df[keep]
+
+    columns = {}
+    if COL_STORE in df.columns:
+        columns[COL_STORE] = df[COL_STORE].astype("category")
+    if COL_AMOUNT in df.columns:
+        values = df[COL_AMOUNT].to_numpy()
+        if values.dtype.kind == "f" and np.array_equal(values, np.round(values)):
+            columns[COL_AMOUNT] = values.astype(np.int64)
+        elif values.dtype.kind == "f":
+            logger.warning("소수점 금액이 있어 float64로 유지합니다")
+    if COL_DT in df.columns and df[COL_DT].dtype != "datetime64[ns]":
+        columns[COL_DT] = pd.to_datetime(df[COL_DT], errors="coerce")
+    df = df.assign(**columns).reset_index(drop=True)
+
+    after = frame_memory(df)
+    logger.info("프레임 압축: %d행, %.1f KB → %.1f KB (%.1f배)", len(df), before / 1024, after / 1024,
+                before / after if after else 0.0)
+    return df
+
+def preprocess_dataframe(df: pd.DataFrame, progress=None, compact: bool = None) -> pd.DataFrame:
+    """가맹점/금액/날짜 전처리 (제외할 행, 금액 부호, 날짜 후보는 df.attrs["profile"]의 프로필을 따름)
+
+    compact가 None이면 설정의 COMPACT_FRAME을 따른다.
+    """
+    compact = COMPACT_FRAME if compact is None else compact
+    profile = get_profile(df.attrs.get("profile"))
+    with tracer.stage(STAGE_NORMALIZE, rows_in=len(df)) as st:
+        df.columns = df.columns.str.strip()
+        if COL_STORE in df.columns:
+            df[COL_STORE] = normalize_text_series(df[COL_STORE])
+            if profile.drop_stores:
+                # take()는 새 프레임을 만들어 이후 컬럼 대입에서 SettingWithCopyWarning이 나지 않는다
+                df = df.take(np.flatnonzero(~df[COL_STORE].isin(profile.drop_stores).to_numpy()))
+        if COL_AMOUNT in df.columns:
+            # 금액은 여기서 한 번만 숫자로 바꾸고 이후 단계는 그대로 쓴다
+            df[COL_AMOUNT] = pd.to_numeric(df[COL_AMOUNT], errors="coerce").fillna(0)
+            if profile.amount_sign < 0:
+                df[COL_AMOUNT] = -df[COL_AMOUNT]
+        st.set_output(df)
+    report_progress(progress, STAGE_NORMALIZE)
+
+    with tracer.stage(STAGE_DATES, rows_in=len(df)) as st:
+        df = normalize_DT_column(df, profile.date_keys)
+
+        # 가맹점은 이미 정리된 문자열, 금액은 이미 숫자이므로 다시 변환하지 않는다
+        is_tx = np.ones(len(df), dtype=bool)
+        if COL_STORE in df.columns:
+            is_tx &= df[COL_STORE].ne("").to_numpy()
+        if COL_AMOUNT in df.columns:
+            is_tx &= df[COL_AMOUNT].ne(0).to_numpy()
+        df["_is_tx"] = is_tx
+        st.set_output(df)
+    report_progress(progress, STAGE_DATES)
+
+    if compact:
+        # 카테고리 분류 전에 줄여 두면 분류도 categorical 가맹점의 고유값만 본다
+        with tracer.stage(STAGE_COMPACT, rows_in=len(df)) as st:
+            df = compact_frame(df)
+            st.set_output(df)
+
+    with tracer.stage(STAGE_CATEGORY, rows_in=len(df)) as st:
+        df = assign_categories(df)
+        st.set_output(df)
+
+    return df
+
+def load_and_preprocess(path: str, progress=None) -> pd.DataFrame:
+    """엑셀 로드 + 전처리를 한 번에 수행"""
+    return preprocess_dataframe(load_excel_from_path(path, progress), progress)
+
+def keyword_mask(df: pd.DataFrame, keywords: list, masks=None) -> pd.Series:
+    """가맹점명에 키워드 중 하나라도 포함된 행 True (키워드가 없으면 None = 전체)
+
+    masks(MaskCache)를 주면 키워드별 마스크를 캐시에서 재사용한다.
+    """
+    if COL_STORE not in df.columns or COL_AMOUNT not in df.columns:
+        raise ValueError(f"'{COL_STORE}' 또는 '{COL_AMOUNT}' 컬럼이 없습니다.")
+    if not keywords:
+        return None
+    if masks is not None:
+        return masks.mask(df, df[COL_STORE], keywords)
+    return keyword_matcher(tuple(keywords)).mask(df[COL_STORE])
+
+def filter_by_keywords(df: pd.DataFrame, keywords: list, progress=None, masks=None) -> pd.DataFrame:
+    """가맹점명에 키워드 중 하나라도 포함된 행만 반환 (키워드가 없으면 df 그대로)
+
+    전처리가 끝난 프레임은 읽기 전용으로 다루므로 방어적 복사를 하지 않는다.
+    """
+    with tracer.stage(STAGE_FILTER, rows_in=len(df)) as st:
+        mask = keyword_mask(df, keywords, masks)
+        result = df if mask is None else df[mask]
+        st.set_output(result)
+    report_progress(progress, STAGE_FILTER)
+    return result
+
+def keyword_totals(df: pd.DataFrame, keywords: list) -> pd.DataFrame:
+    """키워드별 매칭 건수/합계 표 (마지막 행은 키워드 OR 조건 전체)"""
+    if not keywords:
+        # 키워드가 없으면 전체 행이 합계 (filter_by_keywords와 같은 기준)
+        return pd.DataFrame([{"키워드": "합계", "건수": len(df), COL_AMOUNT: df[COL_AMOUNT].sum()}])
+    rows = []
+    masks = keyword_matcher(tuple(keywords)).keyword_masks(df[COL_STORE])
+    any_mask = pd.Series(False, index=df.index)
+    for kw in keywords:
+        mask = masks[kw]
+        any_mask |= mask
+        rows.append({"키워드": kw, "건수": int(mask.sum()), COL_AMOUNT: df.loc[mask, COL_AMOUNT].sum()})
+    rows.append({"키워드": "합계", "건수": int(any_mask.sum()), COL_AMOUNT: df.loc[any_mask, COL_AMOUNT].sum()})
+    return pd.DataFrame(rows)
+
+def generate_category_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """카테고리별 금액 합계 (로드 시 계산된 카테고리 컬럼 재사용)"""
+    df = ensure_categories(df)
+    summary = df.groupby(COL_CATEGORY, as_index=False, observed=True)[COL_AMOUNT].sum()
+    summary[COL_CATEGORY] = summary[COL_CATEGORY].astype(str)
+    return summary
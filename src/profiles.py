@@ -0,0 +1,124 @@
+"""
+명세서 형식 프로필
+--------------------------------
+카드사/은행마다 다른 엑셀 양식을 프로필 하나로 기술한다 (config.json의 STATEMENT_PROFILES).
+
+- header_row: 헤더 행 번호 (0부터, null이면 앞쪽 행에서 자동 탐지)
+- store / amount: 그 양식의 가맹점/금액 컬럼명 (읽은 뒤 COL_STORE/COL_AMOUNT로 이름을 바꾼다)
+- date_keys: 날짜 후보 컬럼에 포함된 문구 (없으면 DATE_COL_KEYS)
+- amount_sign: 지출이 음수로 기록되는 양식은 -1
+- drop_stores: 거래가 아닌 행(반복 헤더, 할인 안내 등)의 가맹점 값
+- markers: 앞쪽 행에 있으면 이 양식으로 보는 문구 (카드사 이름 등, 선택)
+
+파일마다 앞쪽 HEADER_SCAN_ROWS행만 읽어(지문) 점수가 가장 높은 프로필을 고르므로
+여러 양식이 섞인 파일 묶음도 전체를 시험 파싱하지 않고 한 번에 읽는다.
+"""
+
+import json, hashlib
+from collections import namedtuple
+from functools import lru_cache
+
+from config import get_config
+
+StatementProfile = namedtuple(
+    "StatementProfile",
+    "name header_row store amount date_keys amount_sign drop_stores markers",
+)
+
+# 헤더 행 점수: 가맹점+금액 컬럼이 모두 있어야 후보가 되고, 날짜 컬럼/표식 문구는 가산점
+SCORE_COLUMNS = 4
+SCORE_DATE = 1
+SCORE_MARKER = 2
+
+def default_profile(config: dict) -> StatementProfile:
+    """STATEMENT_PROFILES가 없을 때 쓰는 기존 양식 (COL_STORE/COL_AMOUNT 그대로)"""
+    return StatementProfile(
+        name="기본",
+        header_row=None,
+        store=config["COL_STORE"],
+        amount=config["COL_AMOUNT"],
+        date_keys=list(config["DATE_COL_KEYS"]),
+        amount_sign=1,
+        drop_stores=[config["COL_STORE"], "올라운드 선택1 할인"],
+        markers=[],
+    )
+
+def profile_from_dict(entry: dict, config: dict) -> StatementProfile:
+    base = default_profile(config)
+    return StatementProfile(
+        name=entry["name"],
+        header_row=entry.get("header_row"),
+        store=entry.get("store", base.store),
+        amount=entry.get("amount", base.amount),
+        date_keys=list(entry.get("date_keys", base.date_keys)),
+        amount_sign=-1 if entry.get("amount_sign", 1) < 0 else 1,
+        drop_stores=list(entry.get("drop_stores", [])),
+        markers=list(entry.get("markers", [])),
+    )
+
+@lru_cache(maxsize=1)
+def load_profiles() -> tuple:
+    """설정의 프로필 목록 (앞에 있을수록 동점일 때 우선)"""
+    config = get_config()
+    entries = config.get("STATEMENT_PROFILES")
+    if not entries:
+        return (default_profile(config),)
+    return tuple(profile_from_dict(e, config) for e in entries)
+
+def get_profile(name: str = None) -> StatementProfile:
+    """이름으로 프로필 찾기 (없거나 None이면 첫 번째 프로필)"""
+    profiles = load_profiles()
+    for profile in profiles:
+        if profile.name == name:
+            return profile
+    return profiles[0]
+
+def profiles_fingerprint() -> str:
+    """프로필 설정 지문 (캐시 키에 포함)"""
+    payload = json.dumps([p._asdict() for p in load_profiles()], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+# ===============================
+# 양식 판별 (지문)
+# ===============================
+def _cell_texts(row) -> list:
+    return [str(c).strip() for c in row if c is not None and str(c).strip()]
+
+def score_profile(profile: StatementProfile, rows: list) -> tuple:
+    """앞쪽 행(rows)에 대한 (점수, 헤더 행 번호) (맞는 헤더가 없으면 (0, None))"""
+    if profile.header_row is not None:
+        candidates = [profile.header_row] if profile.header_row < len(rows) else []
+    else:
+        candidates = range(len(rows))
+
+    best_score, best_idx = 0, None
+    for idx in candidates:
+        names = _cell_texts(rows[idx])
+        if profile.store not in names or profile.amount not in names:
+            continue
+        score = SCORE_COLUMNS
+        if any(k in n for n in names for k in profile.date_keys):
+            score += SCORE_DATE
+        if score > best_score:
+            best_score, best_idx = score, idx
+    if best_idx is None:
+        return 0, None
+
+    if profile.markers:
+        text = " ".join(t for row in rows for t in _cell_texts(row))
+        best_score += SCORE_MARKER * sum(m in text for m in profile.markers)
+    return best_score, best_idx
+
+def identify(rows: list) -> tuple:
+    """앞쪽 행으로 (프로필, 헤더 행 번호)를 고른다
+
+    어느 프로필도 맞지 않으면 첫 번째 프로필과 None(헤더 자동 탐지, 기존 동작)을 반환한다.
+    """
+    best, best_score, best_idx = None, 0, None
+    for profile in load_profiles():
+        score, idx = score_profile(profile, rows)
+        if score > best_score:
+            best, best_score, best_idx = profile, score, idx
+    if best is None:
+        return load_profiles()[0], None
+    return best, best_idx
@@ -0,0 +1,143 @@
+"""
+명세서 엑셀 리더
+--------------------------------
+openpyxl read-only 모드로 시트를 한 줄씩 읽으며 필요한 컬럼만 모은다.
+
+- 앞쪽 몇 줄에서 가맹점/금액/날짜 컬럼명이 있는 행을 헤더로 찾는다 (다시 파싱하지 않음)
+  헤더 행을 이미 알면(형식 프로필, profiles.py) 탐지를 건너뛴다
+- 헤더에서 찾은 컬럼만 CHUNK_ROWS 단위로 DataFrame으로 만들어 이어 붙인다
+- .xls 등 openpyxl이 못 읽는 형식은 앞부분만 미리 읽어 헤더를 찾은 뒤 pandas로 한 번만 읽는다
+"""
+
+import logging
+from itertools import islice
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+HEADER_SCAN_ROWS = 10
+CHUNK_ROWS = 50_000
+
+# ===============================
+# 헤더 탐지
+# ===============================
+def make_column_names(cells) -> list:
+    """헤더 셀을 pandas와 같은 규칙의 컬럼명으로 (빈 칸은 Unnamed: i, 중복은 .1 .2)"""
+    names, seen = [], {}
+    for i, cell in enumerate(cells):
+        name = str(cell).strip() if cell is not None and str(cell).strip() else f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+def is_wanted_column(name: str, required: list, date_keys: list, extra=()) -> bool:
+    return name in required or name in extra or any(k in name for k in date_keys)
+
+def detect_header(rows: list, required: list, date_keys: list) -> int:
+    """필수 컬럼명이 가장 많이 포함된 행 번호 (못 찾으면 기존 동작처럼 두 번째 행)"""
+    best_idx, best_score = None, 0
+    for idx, row in enumerate(rows):
+        names = [str(c).strip() for c in row if c is not None]
+        score = sum(2 for r in required if r in names)
+        score += any(any(k in n for k in date_keys) for n in names)
+        if score > best_score:
+            best_idx, best_score = idx, score
+    if best_idx is None:
+        return 1 if len(rows) > 1 else 0
+    return best_idx
+
+def preview_rows(path: str, n: int = HEADER_SCAN_ROWS) -> list:
+    """앞쪽 n행만 셀 값 튜플로 읽는다 (빈 칸은 None)"""
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            return list(islice(wb.worksheets[0].iter_rows(values_only=True), n))
+        finally:
+            wb.close()
+    preview = pd.read_excel(path, header=None, nrows=n)
+    return [tuple(None if pd.isna(v) else v for v in r) for r in preview.itertuples(index=False)]
+
+# ===============================
+# 읽기
+# ===============================
+def _rows_to_frame(names: list, positions: list, rows) -> pd.DataFrame:
+    """행 이터레이터에서 positions 컬럼만 CHUNK_ROWS 단위로 모아 DataFrame 생성"""
+    chunks = []
+    buf = [[] for _ in positions]
+    count = 0
+
+    def flush():
+        chunks.append(pd.DataFrame({n: col for n, col in zip(names, buf)}))
+        for col in buf:
+            col.clear()
+
+    for row in rows:
+        values = [row[p] if p < len(row) else None for p in positions]
+        if all(v is None for v in values):
+            continue
+        for col, v in zip(buf, values):
+            col.append(v)
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            flush()
+    if (buf and buf[0]) or not chunks:
+        flush()
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def read_xlsx_streaming(path: str, required: list, date_keys: list, header_idx: int = None,
+                        extra=()) -> pd.DataFrame:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        preview = list(islice(rows, max(HEADER_SCAN_ROWS, (header_idx or 0) + 1)))
+        if header_idx is None:
+            header_idx = detect_header(preview, required, date_keys)
+        header = preview[header_idx] if header_idx < len(preview) else ()
+        all_names = make_column_names(header)
+
+        positions = [i for i, n in enumerate(all_names) if is_wanted_column(n, required, date_keys, extra)]
+        if not all(r in all_names for r in required):
+            # 필수 컬럼이 없으면 투영하지 않고 모든 컬럼을 그대로 둔다 (이후 단계에서 오류 안내)
+            positions = list(range(len(all_names)))
+        names = [all_names[i] for i in positions]
+
+        body = (r for part in (preview[header_idx + 1:], rows) for r in part)
+        df = _rows_to_frame(names, positions, body)
+    finally:
+        wb.close()
+
+    logger.info("헤더 %d행, 컬럼 %d/%d개 사용: %s", header_idx + 1, len(names), len(all_names), names)
+    return df
+
+def read_excel_projected(path: str, required: list, date_keys: list, header_idx: int = None,
+                         extra=()) -> pd.DataFrame:
+    """openpyxl이 못 읽는 형식: 앞부분만 읽어 헤더를 찾고 필요한 컬럼만 한 번 파싱
+
+    header_idx를 주면 그 행에 필수 컬럼이 있다고 보고 미리 읽기를 생략한다.
+    """
+    if header_idx is None:
+        rows = preview_rows(path)
+        header_idx = detect_header(rows, required, date_keys)
+        names = make_column_names(rows[header_idx]) if header_idx < len(rows) else []
+    else:
+        names = required
+    if all(r in names for r in required):
+        usecols = lambda c: is_wanted_column(str(c).strip(), required, date_keys, extra)
+    else:
+        usecols = None
+    return pd.read_excel(path, header=header_idx, usecols=usecols)
+
+def read_statement(path: str, required: list, date_keys: list, header_idx: int = None,
+                   extra=()) -> pd.DataFrame:
+    """명세서 파일을 읽어 필요한 컬럼(+ 있으면 extra 컬럼)만 담은 DataFrame 반환 (header_idx가 None이면 헤더 탐지)"""
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return read_xlsx_streaming(path, required, date_keys, header_idx, extra)
+    return read_excel_projected(path, required, date_keys, header_idx, extra)
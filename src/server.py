@@ -0,0 +1,415 @@
+"""
+로컬 조회 서버
+--------------------------------
+명세서를 한 번 읽어 메모리에 올려 두고 HTTP/JSON으로 조회한다 (GUI 없이 스크립트/대시보드용).
+
+- 데이터셋마다 누적 장부(Ledger)를 하나 두고, 같은 데이터셋에 여러 파일을 이어 붙일 수 있다
+- 전처리 결과, 카테고리 합계, 기간 집계 큐브, 키워드 마스크 캐시가 요청 사이에 그대로 유지된다
+  → 필터 없는 요약/월별 집계는 미리 묶어 둔 값을 그대로 돌려주고, 키워드 조회는 고유값 단위 마스크를 재사용한다
+- 파일 읽기는 캐시(StatementCache)를 거치므로 재시작 후 다시 불러와도 엑셀을 새로 파싱하지 않는다
+- 기본으로 127.0.0.1에만 바인딩한다 (/load가 로컬 파일 경로를 받으므로 외부에 열지 않는다)
+
+엔드포인트 (GET은 쿼리 문자열, POST는 JSON 본문. 목록 값은 JSON 배열 또는 쉼표 구분 문자열):
+    GET  /health                      상태, 데이터셋 목록
+    GET  /datasets                    데이터셋별 행 수/원본 파일
+    POST /load      {path, dataset?, append?}      파일을 읽어 데이터셋에 올림 (append=false면 새로 만듦)
+    POST /unload    {dataset}
+    GET  /query     dataset, keywords, start, end, category, limit, offset   조건에 맞는 거래 행
+    GET  /summary   dataset, (필터)                카테고리별 합계
+    GET  /series    dataset, freq=day|week|month, (필터)                     기간별 합계/건수
+    GET  /top       dataset, n, (필터)             합계 상위 가맹점
+
+실행 (config.json이 있는 저장소 루트에서):
+    PYTHONPATH=src python -m server --port 8765
+    curl -s localhost:8765/load -d '{"path": "statements/2024-01.xlsx", "dataset": "2024"}'
+    curl -s "localhost:8765/query?dataset=2024&keywords=카페,스타벅스&start=2024-01-01&end=2024-01-31"
+    curl -s "localhost:8765/series?dataset=2024&freq=month"
+"""
+
+import sys, os, json, time, argparse, logging, threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+import numpy as np
+import pandas as pd
+
+from pipeline import (
+    CONFIG, COL_STORE, COL_AMOUNT, COL_DT, COL_CATEGORY,
+    ensure_categories, keyword_mask, generate_category_summary, close_category_index,
+)
+from cache import StatementCache
+from ledger import Ledger
+from matcher import MaskCache
+from cube import PERIODS, COL_PERIOD, SpendingCube
+from tracing import tracer, trace_path_for
+
+LOG_PATH = CONFIG["LOG_PATH"]
+TRACE_PATH = trace_path_for(LOG_PATH)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10_000
+MAX_BODY = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+class ApiError(Exception):
+    """클라이언트에 그대로 돌려줄 오류 (HTTP 상태 코드 포함)"""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# ===============================
+# 요청 값 해석
+# ===============================
+def param_list(params: dict, name: str) -> list:
+    """목록 파라미터 (JSON 배열 또는 쉼표 구분 문자열)"""
+    value = params.get(name)
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        raise ApiError(400, f"'{name}'은(는) 목록 또는 쉼표 구분 문자열이어야 합니다.")
+    return [str(v).strip() for v in value if str(v).strip()]
+
+def param_int(params: dict, name: str, default: int, low: int = 0, high: int = None) -> int:
+    value = params.get(name, default)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"'{name}'은(는) 정수여야 합니다: {value}")
+    if value < low or (high is not None and value > high):
+        raise ApiError(400, f"'{name}' 범위를 벗어났습니다: {value}")
+    return value
+
+def param_date(params: dict, name: str):
+    value = params.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return pd.Timestamp(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"'{name}' 날짜를 해석할 수 없습니다: {value}")
+
+def param_bool(params: dict, name: str) -> bool:
+    value = params.get(name, False)
+    if isinstance(value, str):
+        return value.lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+def to_records(df: pd.DataFrame, date_cols=()) -> list:
+    """JSON으로 보낼 행 목록 (날짜는 YYYY-MM-DD, 결측은 null)"""
+    out = df.copy()
+    for col in date_cols:
+        if col in out.columns:
+            out[col] = pd.to_datetime(out[col]).dt.strftime("%Y-%m-%d")
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict("records")
+
+def json_default(value):
+    """numpy 스칼라/Timestamp 직렬화"""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+# ===============================
+# 데이터셋 (메모리에 유지되는 장부)
+# ===============================
+class Dataset:
+    def __init__(self, name: str):
+        self.name = name
+        self.ledger = Ledger()
+        self.masks = MaskCache()
+        self.lock = threading.Lock()
+        self.loaded_at = None
+
+    def frame(self) -> pd.DataFrame:
+        """현재 장부 (직접 지정/CATEGORY_MAP이 바뀐 경우에만 카테고리를 다시 계산)"""
+        if self.ledger.frame is None:
+            return pd.DataFrame({COL_DT: [], COL_STORE: [], COL_AMOUNT: [], COL_CATEGORY: []})
+        self.ledger.frame = ensure_categories(self.ledger.frame)
+        return self.ledger.frame
+
+    def info(self) -> dict:
+        return {
+            "dataset": self.name,
+            "rows": len(self.ledger),
+            "sources": [{"path": p, "added": a, "skipped": s} for p, a, s in self.ledger.sources],
+            "loaded_at": self.loaded_at,
+        }
+
+    def select(self, params: dict):
+        """필터 조건에 맞는 행 (필터가 하나도 없으면 (프레임, False))"""
+        df = self.frame()
+        keywords = param_list(params, "keywords")
+        categories = param_list(params, "category")
+        start, end = param_date(params, "start"), param_date(params, "end")
+        if not (keywords or categories or start is not None or end is not None):
+            return df, False
+
+        mask = np.ones(len(df), dtype=bool)
+        if keywords:
+            mask &= keyword_mask(df, keywords, self.masks).to_numpy(dtype=bool)
+        if categories:
+            mask &= df[COL_CATEGORY].astype(str).isin(categories).to_numpy()
+        if start is not None or end is not None:
+            dates = df[COL_DT]
+            if start is not None:
+                mask &= (dates >= start).to_numpy()
+            if end is not None:
+                # 날짜만 주면 그날 전체를 포함
+                if end == end.normalize():
+                    mask &= (dates < end + pd.Timedelta(days=1)).to_numpy()
+                else:
+                    mask &= (dates <= end).to_numpy()
+        return df[mask], True
+
+# ===============================
+# 조회 로직 (HTTP와 무관)
+# ===============================
+class QueryService:
+    def __init__(self, cache: StatementCache = None):
+        self.cache = cache or StatementCache.from_config(CONFIG)
+        self.datasets = {}
+        self._lock = threading.Lock()
+
+    def dataset(self, params: dict) -> Dataset:
+        name = params.get("dataset")
+        with self._lock:
+            if name is None and len(self.datasets) == 1:
+                return next(iter(self.datasets.values()))
+            if name is None:
+                raise ApiError(400, "'dataset'을 지정하세요.")
+            ds = self.datasets.get(str(name))
+        if ds is None:
+            raise ApiError(404, f"데이터셋이 없습니다: {name}")
+        return ds
+
+    # --------------------------
+    # 적재
+    # --------------------------
+    def load(self, params: dict) -> dict:
+        path = params.get("path")
+        if not path:
+            raise ApiError(400, "'path'를 지정하세요.")
+        if not os.path.isfile(path):
+            raise ApiError(404, f"파일이 없습니다: {path}")
+        name = str(params.get("dataset") or os.path.splitext(os.path.basename(path))[0])
+        append = param_bool(params, "append")
+
+        start = time.perf_counter()
+        df = self.cache.load_and_preprocess(path)     # 파싱은 데이터셋 잠금 밖에서
+        with self._lock:
+            ds = self.datasets.get(name) if append else None
+            if ds is None:
+                ds = self.datasets[name] = Dataset(name)
+        with ds.lock:
+            added = ds.ledger.append(df, path)
+            ds.loaded_at = time.strftime("%Y-%m-%d %H:%M:%S")
+            info = ds.info()
+        elapsed = time.perf_counter() - start
+        logger.info("조회 서버 적재: %s → %s (%d행, %.3fs)", path, name, added, elapsed)
+        info.update({"added": added, "profile": df.attrs.get("profile"), "seconds": round(elapsed, 3)})
+        return info
+
+    def unload(self, params: dict) -> dict:
+        ds = self.dataset(params)
+        with self._lock:
+            self.datasets.pop(ds.name, None)
+        logger.info("조회 서버 데이터셋 해제: %s", ds.name)
+        return {"dataset": ds.name, "unloaded": True}
+
+    def list_datasets(self, params: dict) -> dict:
+        with self._lock:
+            datasets = list(self.datasets.values())
+        return {"datasets": [ds.info() for ds in datasets]}
+
+    def health(self, params: dict) -> dict:
+        with self._lock:
+            names = sorted(self.datasets)
+        return {"status": "ok", "datasets": names}
+
+    # --------------------------
+    # 조회
+    # --------------------------
+    def query(self, params: dict) -> dict:
+        ds = self.dataset(params)
+        limit = param_int(params, "limit", DEFAULT_LIMIT, 0, MAX_LIMIT)
+        offset = param_int(params, "offset", 0)
+        with ds.lock:
+            selected, _ = ds.select(params)
+            page = selected.iloc[offset:offset + limit]
+            cols = [c for c in page.columns if not c.startswith("_")]
+            return {
+                "dataset": ds.name,
+                "matched": len(selected),
+                "total": selected[COL_AMOUNT].sum(),
+                "offset": offset,
+                "rows": to_records(page[cols], date_cols=(COL_DT,)),
+            }
+
+    def summary(self, params: dict) -> dict:
+        ds = self.dataset(params)
+        with ds.lock:
+            selected, filtered = ds.select(params)
+            # 필터가 없으면 적재 시점에 새 행만 더해 둔 장부 합계를 그대로 쓴다
+            summary = generate_category_summary(selected) if filtered else ds.ledger.category_summary()
+            return {
+                "dataset": ds.name,
+                "total": summary[COL_AMOUNT].sum(),
+                "categories": to_records(summary),
+            }
+
+    def _cube(self, ds: Dataset, params: dict) -> SpendingCube:
+        selected, filtered = ds.select(params)
+        return SpendingCube.from_frame(selected) if filtered else ds.ledger.spending_cube()
+
+    def series(self, params: dict) -> dict:
+        ds = self.dataset(params)
+        freq = params.get("freq", "month")
+        if freq not in PERIODS:
+            raise ApiError(400, f"'freq'는 {', '.join(PERIODS)} 중 하나여야 합니다: {freq}")
+        with ds.lock:
+            table = self._cube(ds, params).by_period(freq)
+            return {"dataset": ds.name, "freq": freq, "series": to_records(table, date_cols=(COL_PERIOD,))}
+
+    def top(self, params: dict) -> dict:
+        ds = self.dataset(params)
+        n = param_int(params, "n", 10, 1, MAX_LIMIT)
+        with ds.lock:
+            table = self._cube(ds, params).top_merchants(n)
+            return {"dataset": ds.name, "merchants": to_records(table)}
+
+# ===============================
+# HTTP
+# ===============================
+ROUTES = {
+    ("GET", "/health"): "health",
+    ("GET", "/datasets"): "list_datasets",
+    ("POST", "/load"): "load",
+    ("POST", "/unload"): "unload",
+    ("GET", "/query"): "query",
+    ("GET", "/summary"): "summary",
+    ("GET", "/series"): "series",
+    ("GET", "/top"): "top",
+}
+# 조회 엔드포인트는 JSON 본문(POST)으로도 받는다
+ROUTES.update({("POST", path): name for (method, path), name in list(ROUTES.items()) if method == "GET"})
+
+class ApiHandler(BaseHTTPRequestHandler):
+    service = None                  # make_server에서 QueryService를 지정
+    server_version = "ExcelAnalyzer/1"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _read_params(self) -> dict:
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            raise ApiError(413, "요청 본문이 너무 큽니다.")
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length).decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                raise ApiError(400, "요청 본문이 올바른 JSON이 아닙니다.")
+            if not isinstance(body, dict):
+                raise ApiError(400, "요청 본문은 JSON 객체여야 합니다.")
+            params.update(body)
+        return params
+
+    def _dispatch(self, method: str):
+        route = urlsplit(self.path).path.rstrip("/") or "/"
+        start = time.perf_counter()
+        try:
+            name = ROUTES.get((method, route))
+            if name is None:
+                allowed = any(path == route for _, path in ROUTES)
+                raise ApiError(405 if allowed else 404, f"지원하지 않는 요청입니다: {method} {route}")
+            params = self._read_params()
+            with tracer.run(f"api {route}"):
+                payload = getattr(self.service, name)(params)
+            status = 200
+        except ApiError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            logger.exception("조회 서버 요청 처리 실패: %s %s", method, self.path)
+            status, payload = 500, {"error": str(e)}
+        payload["ms"] = round((time.perf_counter() - start) * 1000, 2)
+        self._send(status, payload)
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False, default=json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        logger.info("조회 서버 %s - %s", self.address_string(), fmt % args)
+
+def make_server(service: QueryService = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """서버 생성 (port=0이면 빈 포트를 골라 server.server_address로 알려 준다)"""
+    handler = type("BoundApiHandler", (ApiHandler,), {"service": service or QueryService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+# ===============================
+# 실행부
+# ===============================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m server", description="명세서 로컬 조회 서버")
+    parser.add_argument("paths", nargs="*", help="시작할 때 미리 불러올 명세서 파일")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0이면 빈 포트 사용")
+    parser.add_argument("--dataset", help="미리 불러온 파일을 모을 데이터셋 이름 (기본: 파일마다 따로)")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        filename=LOG_PATH,
+        filemode="a",
+    )
+    tracer.configure(TRACE_PATH)
+    args = parse_args(argv)
+
+    service = QueryService()
+    for path in args.paths:
+        try:
+            info = service.load({"path": path, "dataset": args.dataset, "append": bool(args.dataset)})
+        except ApiError as e:
+            print(f"[실패] {path}: {e}", file=sys.stderr)
+            return 1
+        print(f"[적재] {path} → {info['dataset']}: {info['rows']:,}행, {info['seconds']:.2f}s")
+
+    server = make_server(service, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"조회 서버 실행 중: http://{host}:{port} (Ctrl+C로 종료)", flush=True)
+    logger.info("조회 서버 시작: %s:%d", host, port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        close_category_index()
+        logger.info("조회 서버 종료")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
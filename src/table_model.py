@@ -0,0 +1,95 @@
+"""
+결과 테이블 모델
+--------------------------------
+필터 결과 DataFrame의 컬럼 배열을 그대로 참조하는 QAbstractTableModel.
+셀 문자열은 data()가 호출될 때(화면에 보이는 행만) 만들고,
+정렬은 numpy argsort로 행 순서 배열만 바꾼다.
+"""
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+def _format_date(value) -> str:
+    if np.isnat(value):
+        return ""
+    return np.datetime_as_string(value, unit="D")[2:]   # yy-mm-dd
+
+def _format_amount(value) -> str:
+    return f"{value:,.0f}"
+
+class DataFrameTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._columns = []      # 컬럼별 numpy 배열 (복사하지 않음)
+        self._formatters = []
+        self._order = np.arange(0)
+
+    def set_frame(self, df: pd.DataFrame, columns: list, date_cols=(), amount_cols=()):
+        """표시할 컬럼만 배열로 잡아 두고 뷰를 새로 고친다"""
+        self.beginResetModel()
+        self._headers = [str(c) for c in columns]
+        self._columns = []
+        self._formatters = []
+        for col in columns:
+            if col in date_cols:
+                values = pd.to_datetime(df[col], errors="coerce").to_numpy()
+                self._formatters.append(_format_date)
+            elif col in amount_cols:
+                values = df[col].to_numpy()
+                self._formatters.append(_format_amount)
+            else:
+                values = df[col].to_numpy()
+                self._formatters.append(str)
+            self._columns.append(values)
+        self._order = np.arange(len(df))
+        self.endResetModel()
+
+    # --------------------------
+    # QAbstractTableModel 구현
+    # --------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            c = index.column()
+            return self._formatters[c](self._columns[c][self._order[index.row()]])
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def row_value(self, row: int, column: str):
+        """화면 row행의 column 컬럼 원래 값 (표시하지 않는 컬럼이면 None)"""
+        if column not in self._headers or not 0 <= row < len(self._order):
+            return None
+        return self._columns[self._headers.index(column)][self._order[row]]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if not 0 <= column < len(self._columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        values = self._columns[column]
+        if values.dtype == object:
+            values = values.astype(str)
+        self._order = np.argsort(values, kind="stable")
+        if order == Qt.DescendingOrder:
+            self._order = self._order[::-1]
+            if values.dtype.kind == "M":
+                # 빈 날짜(NaT)는 내림차순에서도 맨 뒤에 둔다
+                nat = np.isnat(values[self._order])
+                self._order = np.concatenate([self._order[~nat], self._order[nat]])
+        self.layoutChanged.emit()
@@ -0,0 +1,184 @@
+"""
+파이프라인 계측
+--------------------------------
+단계별 소요 시간, 입출력 행 수, DataFrame 메모리, 최대 RSS를 기록한다.
+
+- 기록은 LOG_PATH 옆의 *.trace.jsonl 파일에 한 줄씩 JSON으로 남는다
+- 한 번의 작업(run) 안의 단계들은 같은 run_id로 묶인다
+- configure(profile=True)이면 (설정 PROFILE_NEXT_RUN) 그다음 run 하나만 cProfile로 측정해 *.prof로 저장한다
+"""
+
+import os, sys, json, time, itertools, logging, threading, cProfile
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:      # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+def trace_path_for(log_path: str) -> str:
+    return os.path.splitext(log_path)[0] + ".trace.jsonl"
+
+def peak_rss_bytes():
+    """프로세스 최대 RSS (측정할 수 없으면 None)
+
+    POSIX는 getrusage의 ru_maxrss, Windows는 psutil의 peak_wset (현재 RSS는 최대값이 아니므로 쓰지 않는다)
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    if psutil is not None:
+        return getattr(psutil.Process().memory_info(), "peak_wset", None)
+    return None
+
+def frame_bytes(df):
+    try:
+        return int(df.memory_usage(index=True, deep=False).sum())
+    except AttributeError:
+        return None
+
+class Stage:
+    """stage() 블록 안에서 입출력 정보를 채우는 기록 객체"""
+
+    def __init__(self, name: str, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.frame_bytes = None
+        self.ms = None
+
+    def set_output(self, df):
+        self.rows_out = len(df)
+        self.frame_bytes = frame_bytes(df)
+
+class Run:
+    def __init__(self, run_id: int, name: str):
+        self.run_id = run_id
+        self.name = name
+        self.stages = []
+        self.started = time.time()
+        self.ms = None
+
+class Tracer:
+    def __init__(self):
+        self.path = None
+        self.last_run = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profile_pending = False
+
+    def configure(self, path: str, profile: bool = False):
+        self.path = path
+        self._profile_pending = self._profile_pending or profile
+
+    def current_run(self):
+        """현재 스레드에서 진행 중인 run (없으면 None)"""
+        return getattr(self._local, "run", None)
+
+    # --------------------------
+    # 기록
+    # --------------------------
+    def _write(self, record: dict):
+        if not self.path:
+            return
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def _stage_record(self, run, stage: Stage) -> dict:
+        rss = peak_rss_bytes()
+        return {
+            "ts": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "run_id": run.run_id if run else None,
+            "run": run.name if run else None,
+            "stage": stage.name,
+            "ms": round(stage.ms, 2),
+            "rows_in": stage.rows_in,
+            "rows_out": stage.rows_out,
+            "frame_mb": round(stage.frame_bytes / 2**20, 2) if stage.frame_bytes is not None else None,
+            "peak_rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+        }
+
+    @contextmanager
+    def stage(self, name: str, rows_in=None, run=None):
+        """단계 하나를 측정 (run을 주지 않으면 현재 스레드의 run에 붙는다)"""
+        stage = Stage(name, rows_in)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.ms = (time.perf_counter() - start) * 1000
+            target = run or self.current_run()
+            if target is not None:
+                target.stages.append(stage)
+            self._write(self._stage_record(target, stage))
+
+    @contextmanager
+    def run(self, name: str):
+        """작업 하나를 run으로 묶는다 (대기 중인 프로파일 요청이 있으면 이 run을 측정)"""
+        run = Run(next(self._ids), name)
+        outer = self.current_run()
+        self._local.run = run
+        profiler = None
+        if self._profile_pending:
+            self._profile_pending = False
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield run
+        finally:
+            run.ms = (time.perf_counter() - start) * 1000
+            self._local.run = outer
+            if profiler is not None:
+                profiler.disable()
+                self._dump_profile(run, profiler)
+            self._write({"ts": time.strftime("%Y-%m-%d %H:%M:%S"), "run_id": run.run_id,
+                         "run": run.name, "stage": "(total)", "ms": round(run.ms, 2)})
+            self.last_run = run
+
+    def wrap(self, name: str, fn):
+        """fn 호출을 run으로 감싼 함수 반환 (백그라운드 작업용)"""
+        def traced(*args, **kwargs):
+            with self.run(name):
+                return fn(*args, **kwargs)
+        return traced
+
+    def _dump_profile(self, run, profiler):
+        base = (self.path or "trace").replace(".trace.jsonl", "")
+        out = f"{base}.run-{run.run_id}.prof"
+        try:
+            profiler.dump_stats(out)
+            logger.info("cProfile 결과 저장: %s (run %d '%s')", out, run.run_id, run.name)
+        except OSError:
+            logger.exception("cProfile 결과 저장 실패: %s", out)
+
+    # --------------------------
+    # 표시용
+    # --------------------------
+    def format_run(self, run=None) -> str:
+        run = run or self.last_run
+        if run is None:
+            return "(기록 없음)"
+        lines = [f"run {run.run_id} '{run.name}'  총 {run.ms or 0:,.1f} ms",
+                 f"{'단계':<12}{'ms':>10}{'입력 행':>10}{'출력 행':>10}{'DF MB':>9}"]
+        for st in run.stages:
+            mb = f"{st.frame_bytes / 2**20:.1f}" if st.frame_bytes is not None else "-"
+            rows_in = f"{st.rows_in:,}" if st.rows_in is not None else "-"
+            rows_out = f"{st.rows_out:,}" if st.rows_out is not None else "-"
+            lines.append(f"{st.name:<12}{st.ms:>10,.1f}{rows_in:>10}{rows_out:>10}{mb:>9}")
+        rss = peak_rss_bytes()
+        if rss is not None:
+            lines.append(f"최대 RSS {rss / 2**20:,.1f} MB")
+        return "\n".join(lines)
+
+tracer = Tracer()
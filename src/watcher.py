@@ -0,0 +1,100 @@
+"""
+감시 폴더 기록
+--------------------------------
+감시 폴더의 엑셀 파일마다 마지막으로 장부에 반영한 (크기, mtime, 내용 해시)를 기록해 두고
+새로 생겼거나 내용이 바뀐 파일만 골라낸다. Qt와 무관하며 GUI(main)에서 감시/작업 관리를 맡는다.
+
+- 훑기(scan)는 stat만 한다 → 크기/mtime이 기록과 같으면 건너뛴다
+- 크기/mtime이 달라진 파일은 작업 스레드에서 내용 해시를 비교해, 저장만 다시 한 파일은 읽지 않는다
+- 아직 쓰는 중일 수 있는 파일(mtime이 settle_sec 이내)은 다음 훑기로 미룬다
+- 읽기에 실패한 파일은 크기/mtime이 다시 바뀔 때까지 건너뛴다
+- 읽기는 StatementCache를 거치므로 이전 실행에서 읽은 파일은 엑셀을 다시 파싱하지 않는다
+"""
+
+import os, time, logging, threading
+
+from cache import file_content_hash
+
+logger = logging.getLogger(__name__)
+
+EXCEL_EXTS = (".xlsx", ".xls")
+
+def file_signature(path: str) -> tuple:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime
+
+class FolderState:
+    def __init__(self, folder: str, settle_sec: float = 1.0):
+        self.folder = os.path.abspath(folder)
+        self.settle_sec = settle_sec
+        self._lock = threading.Lock()
+        self._files = {}            # 절대 경로 → (크기, mtime, 내용 해시)
+        self._failed = {}           # 읽기에 실패한 파일 → 그때의 (크기, mtime) (바뀌기 전까지 다시 시도하지 않음)
+
+    def __len__(self):
+        return len(self._files)
+
+    def list_files(self) -> list:
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            logger.warning("감시 폴더를 읽을 수 없습니다: %s", self.folder)
+            return []
+        # 엑셀이 열려 있는 동안 생기는 잠금 파일(~$이름.xlsx)은 제외
+        return sorted(os.path.join(self.folder, n) for n in names
+                      if n.lower().endswith(EXCEL_EXTS) and not n.startswith("~$")
+                      and os.path.isfile(os.path.join(self.folder, n)))
+
+    def scan(self, now: float = None) -> tuple:
+        """(반영할 후보 [(경로, 크기/mtime)], 아직 쓰는 중이라 미룬 파일 수)"""
+        now = time.time() if now is None else now
+        changed, settling = [], 0
+        with self._lock:
+            known = dict(self._files)
+            failed = dict(self._failed)
+        for path in self.list_files():
+            try:
+                signature = file_signature(path)
+            except OSError:
+                continue
+            recorded = known.get(path)
+            if (recorded is not None and recorded[:2] == signature) or failed.get(path) == signature:
+                continue
+            if now - signature[1] < self.settle_sec:
+                settling += 1
+                continue
+            changed.append((path, signature))
+        return changed, settling
+
+    def is_unchanged(self, path: str, content_hash: str) -> bool:
+        """내용이 마지막으로 반영한 것과 같은지 (mtime만 바뀐 경우)"""
+        with self._lock:
+            recorded = self._files.get(path)
+        return recorded is not None and recorded[2] == content_hash
+
+    def record(self, path: str, signature: tuple, content_hash: str):
+        with self._lock:
+            self._files[path] = (signature[0], signature[1], content_hash)
+            self._failed.pop(path, None)
+
+    def record_failure(self, path: str, signature: tuple):
+        with self._lock:
+            self._failed[path] = signature
+
+    def forget_missing(self) -> list:
+        """폴더에서 사라진 파일의 기록을 지우고 그 경로 목록을 반환"""
+        present = set(self.list_files())
+        with self._lock:
+            missing = [p for p in self._files if p not in present]
+            for p in missing:
+                del self._files[p]
+            for p in [p for p in self._failed if p not in present]:
+                del self._failed[p]
+        return missing
+
+def read_if_changed(state: FolderState, cache, path: str, signature: tuple, progress=None) -> tuple:
+    """(경로, 크기/mtime, 내용 해시, DataFrame 또는 내용이 같으면 None) (작업 스레드에서 실행)"""
+    content_hash = file_content_hash(path)
+    if state.is_unchanged(path, content_hash):
+        return path, signature, content_hash, None
+    return path, signature, content_hash, cache.load_and_preprocess(path, progress, content_hash=content_hash)
@@ -0,0 +1,65 @@
+"""
+백그라운드 작업 실행기
+--------------------------------
+파이프라인 작업을 QThreadPool에서 실행하고 단계별 진행률/취소를 UI에 전달한다.
+"""
+
+import logging
+import threading
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from pipeline import PipelineCancelled
+
+logger = logging.getLogger(__name__)
+
+class WorkerSignals(QObject):
+    """작업 스레드 → UI 스레드 신호 (모두 요청 id를 첫 인자로 전달)"""
+    progress = Signal(int, int, int, str)   # id, 완료 단계 수, 전체 단계 수, 단계 이름
+    finished = Signal(int, object)          # id, 결과
+    failed = Signal(int, str)               # id, 오류 메시지
+    cancelled = Signal(int)                 # id
+
+class PipelineWorker(QRunnable):
+    """fn(*args, progress=콜백)을 실행하는 QRunnable
+
+    fn은 각 단계가 끝날 때마다 progress(단계 이름)을 호출해야 한다.
+    cancel() 이후 다음 progress 호출에서 PipelineCancelled가 발생해 작업이 중단된다.
+    """
+
+    def __init__(self, request_id: int, stages: list, fn, *args):
+        super().__init__()
+        self.request_id = request_id
+        self.stages = stages
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+        self._done = 0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _progress(self, stage: str):
+        if self.is_cancelled():
+            raise PipelineCancelled(stage)
+        self._done = min(self._done + 1, len(self.stages))
+        self.signals.progress.emit(self.request_id, self._done, len(self.stages), stage)
+
+    def run(self):
+        try:
+            if self.is_cancelled():
+                raise PipelineCancelled("시작 전")
+            result = self.fn(*self.args, progress=self._progress)
+            if self.is_cancelled():
+                raise PipelineCancelled("완료 후")
+        except PipelineCancelled as e:
+            logger.info("작업 %d 취소됨 (%s)", self.request_id, e)
+            self.signals.cancelled.emit(self.request_id)
+        except Exception as e:
+            logger.exception("작업 %d 실패", self.request_id)
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, result)
@@ -0,0 +1,102 @@
+"""
+조회 서버 왕복 테스트
+--------------------------------
+127.0.0.1의 빈 포트(port=0)로 서버를 띄워 /load → /query → /summary를 실제 HTTP로 주고받고,
+잘못된 요청(400/404)도 JSON 본문으로 오류를 돌려주는지 확인한다.
+
+실행 (저장소 루트에서):
+    python -m pytest -q tests
+"""
+
+import os, sys, json, threading
+import urllib.request, urllib.error
+from urllib.parse import urlencode
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic import write_statement
+from pipeline import COL_AMOUNT, close_category_index, filter_by_keywords
+from cache import StatementCache
+from server import QueryService, make_server
+
+ROWS = 500
+KEYWORD = "스타벅스"
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    """(기본 URL, 명세서 경로, 같은 파일을 직접 전처리한 DataFrame)"""
+    tmp = tmp_path_factory.mktemp("server")
+    cwd = os.getcwd()
+    # 카테고리 색인(상대 경로)이 저장소가 아니라 임시 폴더에 생기도록
+    os.chdir(tmp)
+    cache = StatementCache(str(tmp / "cache"), 64 * 2**20)
+    path = write_statement(str(tmp / "statement.xlsx"), ROWS, seed=1)
+    server = make_server(QueryService(cache), "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    try:
+        yield f"http://{host}:{port}", path, cache.load_and_preprocess(path)
+    finally:
+        server.shutdown()
+        server.server_close()
+        close_category_index()
+        os.chdir(cwd)
+
+def call(base: str, route: str, body: dict = None, **query) -> tuple:
+    """(상태 코드, JSON 본문) — body가 있으면 POST"""
+    url = f"{base}{route}" + (f"?{urlencode(query)}" if query else "")
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as resp:
+            return resp.status, json.loads(resp.read().decode("utf-8"))
+    except urllib.error.HTTPError as e:
+        assert e.headers.get("Content-Type", "").startswith("application/json")
+        return e.code, json.loads(e.read().decode("utf-8"))
+
+def test_load_query_summary_round_trip(api):
+    base, path, df = api
+
+    status, loaded = call(base, "/load", {"path": path, "dataset": "t"})
+    assert status == 200
+    assert loaded["dataset"] == "t"
+    assert loaded["rows"] == loaded["added"] == len(df)
+
+    status, result = call(base, "/query", dataset="t", keywords=KEYWORD, limit=5)
+    expected = filter_by_keywords(df, [KEYWORD])
+    assert status == 200
+    assert result["matched"] == len(expected) > 0
+    assert result["total"] == pytest.approx(float(expected[COL_AMOUNT].sum()))
+    assert len(result["rows"]) == min(5, len(expected))
+    assert all(KEYWORD in row["이용하신 가맹점"] for row in result["rows"])
+
+    status, summary = call(base, "/summary", dataset="t")
+    assert status == 200
+    assert summary["total"] == pytest.approx(float(df[COL_AMOUNT].sum()))
+    assert sum(c[COL_AMOUNT] for c in summary["categories"]) == pytest.approx(summary["total"])
+
+    # 같은 조회를 POST(JSON 본문)로 보내도 결과가 같다
+    status, posted = call(base, "/query", {"dataset": "t", "keywords": [KEYWORD], "limit": 5})
+    assert status == 200
+    assert (posted["matched"], posted["total"]) == (result["matched"], result["total"])
+
+@pytest.mark.parametrize("route, body, query, expected", [
+    ("/load", {}, {}, 400),                                     # path 없음
+    ("/series", None, {"dataset": "t", "freq": "year"}, 400),   # 지원하지 않는 주기
+    ("/query", None, {"dataset": "t", "limit": "many"}, 400),   # 정수가 아닌 값
+    ("/query", None, {"dataset": "없는-데이터셋"}, 404),
+    ("/load", {"path": "없는-파일.xlsx"}, {}, 404),
+    ("/nowhere", None, {}, 404),
+])
+def test_errors_are_json(api, route, body, query, expected):
+    base, path, _ = api
+    call(base, "/load", {"path": path, "dataset": "t"})
+    status, payload = call(base, route, body, **query)
+    assert status == expected
+    assert isinstance(payload["error"], str) and payload["error"]
+    assert "ms" in payload